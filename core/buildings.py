@@ -36,13 +36,16 @@ class Building:
     role: Optional[str] = None
     level: int = 1
     id: str = field(init=False)
-    production_report: Dict[str, object] = field(default_factory=dict)
+    production_report: Optional[Dict[str, object]] = None
 
     def __post_init__(self) -> None:
         self.id = config.resolve_building_public_id(self.type_key)
         self._maintenance_notified = False
         self._last_effective_rate = 0.0
-        self.production_report = self._new_report()
+        self._cycle_plan_cache: Optional[Tuple[object, ...]] = None
+        self._static_snapshot_cache: Optional[Tuple[object, int, Dict[str, object]]] = None
+        if self.production_report is None:
+            self.production_report = self._new_report()
         self.category = (self.category or "general").strip().lower() or "general"
         if not self.category_label:
             self.category_label = self.category.title()
@@ -147,10 +150,34 @@ class Building:
     ) -> float:
         """Return the effective production rate for ``workers`` and ``modifiers``."""
 
-        if self.max_workers <= 0:
+        return self._effective_rate_with_cached_max(workers, self.max_workers, modifiers)
+
+    def _effective_rate_with_cached_max(
+        self,
+        workers: int,
+        max_workers: int,
+        modifiers: Mapping[str, float] | float | None,
+    ) -> float:
+        """Variant of :meth:`effective_rate` using an already known ``max_workers``."""
+
+        if type(modifiers) is not float:
+            return self._effective_rate_slow(workers, max_workers, modifiers)
+        if max_workers <= 0 or workers <= 0:
+            return 0.0
+        if workers >= max_workers:
+            return modifiers
+        return (workers / max_workers) * modifiers
+
+    def _effective_rate_slow(
+        self,
+        workers: int,
+        max_workers: int,
+        modifiers: Mapping[str, float] | float | None,
+    ) -> float:
+        if max_workers <= 0:
             base = 0.0
         else:
-            base = min(1.0, max(0.0, workers / self.max_workers))
+            base = min(1.0, max(0.0, workers / max_workers))
 
         modifier_value = self._modifier_multiplier(modifiers)
         return base * modifier_value
@@ -185,9 +212,10 @@ class Building:
     ) -> Dict[str, object]:
         """Advance the building logic by ``dt`` seconds."""
 
-        report = self._new_report()
-        inactive_reason = self._inactive_reason()
+        max_workers = self.max_workers
+        inactive_reason = self._inactive_reason(max_workers)
         if inactive_reason:
+            report = self._new_report()
             self._apply_inactive_status(inactive_reason)
             report["status"] = "inactive"
             report["reason"] = inactive_reason
@@ -195,18 +223,55 @@ class Building:
             self.production_report = report
             return report
 
+        return self._tick_active(dt, inventory, notify, modifiers, max_workers)
+
+    def _tick_active(
+        self,
+        dt: float,
+        inventory: Inventory,
+        notify,
+        modifiers: Mapping[str, float] | float | None,
+        max_workers: int,
+    ) -> Dict[str, object]:
+        """Run the production step for an active building.
+
+        :class:`ContinuousBuilding` and :class:`CycleBuilding` override this to
+        skip the recipe shape check performed here for plain instances.
+        """
+
         if self.per_worker_output_rate:
-            report = self._tick_continuous(dt, inventory, notify, modifiers)
-            self.production_report = {
-                "status": report.get("status"),
-                "reason": report.get("reason"),
-                "detail": report.get("detail"),
-                "consumed": dict(report.get("consumed", {})),
-                "produced": dict(report.get("produced", {})),
-            }
-            return report
+            return self._tick_continuous_recorded(dt, inventory, notify, modifiers)
+        return self._tick_cycle(dt, inventory, notify, modifiers, max_workers)
 
-        rate = self.effective_rate(self.assigned_workers, modifiers)
+    def _tick_continuous_recorded(
+        self,
+        dt: float,
+        inventory: Inventory,
+        notify,
+        modifiers: Mapping[str, float] | float | None,
+    ) -> Dict[str, object]:
+        report = self._tick_continuous(dt, inventory, notify, modifiers)
+        self.production_report = {
+            "status": report.get("status"),
+            "reason": report.get("reason"),
+            "detail": report.get("detail"),
+            "consumed": dict(report.get("consumed", {})),
+            "produced": dict(report.get("produced", {})),
+        }
+        return report
+
+    def _tick_cycle(
+        self,
+        dt: float,
+        inventory: Inventory,
+        notify,
+        modifiers: Mapping[str, float] | float | None,
+        max_workers: int,
+    ) -> Dict[str, object]:
+        report = self._new_report()
+        rate = self._effective_rate_with_cached_max(
+            self.assigned_workers, max_workers, modifiers
+        )
         self._last_effective_rate = rate
         if rate <= 0:
             self._apply_inactive_status("inactive")
@@ -224,8 +289,9 @@ class Building:
             self.production_report = report
             return report
 
-        total_consumed: Dict[Resource, float] = {}
-        total_produced: Dict[Resource, float] = {}
+        # Accumulated straight into payload form so no conversion pass is needed.
+        total_consumed: Dict[str, float] = {}
+        total_produced: Dict[str, float] = {}
         final_status = "inactive"
         final_reason: Optional[str] = "inactive"
         final_detail: Optional[object] = None
@@ -267,8 +333,8 @@ class Building:
 
         report["status"] = final_status
         report["reason"] = final_reason
-        report["consumed"] = self._resources_to_payload(total_consumed)
-        report["produced"] = self._resources_to_payload(total_produced)
+        report["consumed"] = total_consumed
+        report["produced"] = total_produced
         report["detail"] = final_detail
 
         if final_status == "produced":
@@ -311,11 +377,13 @@ class Building:
             self.cycle_progress = 0.0
             return report
 
+        # Every per-worker rate below is scaled by the same tick factor.
+        scale = multiplier * dt
         effective_workers = workers
         limiting_resource: Optional[Resource] = None
         if per_worker_inputs:
             for resource, rate in per_worker_inputs.items():
-                required_per_worker = float(rate) * multiplier * dt
+                required_per_worker = rate * scale
                 if required_per_worker <= 0:
                     continue
                 available = inventory.get_amount(resource)
@@ -338,15 +406,16 @@ class Building:
             self.cycle_progress = 0.0
             return report
 
+        worker_scale = effective_workers * scale
         consumption: Dict[Resource, float] = {}
         for resource, rate in per_worker_inputs.items():
-            amount = effective_workers * float(rate) * multiplier * dt
+            amount = rate * worker_scale
             if amount > 0:
                 consumption[resource] = amount
 
         produced_amounts: Dict[Resource, float] = {}
         for resource, rate in per_worker_outputs.items():
-            amount = effective_workers * float(rate) * multiplier * dt
+            amount = rate * worker_scale
             if amount > 0:
                 produced_amounts[resource] = amount
 
@@ -388,8 +457,7 @@ class Building:
         residual = inventory.add(produced_amounts)
         if residual:
             if consumption:
-                for resource, amount in consumption.items():
-                    inventory.set_amount(resource, inventory.get_amount(resource) + amount)
+                inventory.credit(consumption)
             self.status = "capacidad_llena"
             report["status"] = "stalled"
             report["reason"] = "no_capacity"
@@ -406,12 +474,12 @@ class Building:
         return report
 
     # ------------------------------------------------------------------
-    def _inactive_reason(self) -> Optional[str]:
+    def _inactive_reason(self, max_workers: int) -> Optional[str]:
         if not self.built:
             return "inactive"
         if not self.enabled:
             return "inactive"
-        if self.assigned_workers <= 0 or self.max_workers <= 0:
+        if self.assigned_workers <= 0 or max_workers <= 0:
             return "no_workers"
         return None
 
@@ -442,8 +510,7 @@ class Building:
         self,
         inventory: Inventory,
     ) -> Tuple[bool, Dict[Resource, float], Dict[Resource, float], Optional[str], Optional[str]]:
-        maintenance = dict(self.maintenance_per_cycle)
-        inputs = dict(self.inputs_per_cycle)
+        _, maintenance, inputs, combined_inputs, outputs, touched = self._cycle_plan()
 
         if maintenance and not inventory.has(maintenance):
             missing = self._first_missing_resource(maintenance, inventory)
@@ -454,16 +521,18 @@ class Building:
             detail = missing.value if isinstance(missing, Resource) else "inputs"
             return False, {}, {}, "missing_input", detail
 
-        combined_inputs = self._combine_resources(inputs, maintenance)
-        outputs = dict(self.outputs_per_cycle)
-
         if outputs and not inventory.can_add(outputs):
             return False, {}, {}, "no_capacity", None
 
-        touched = set(combined_inputs) | set(outputs)
+        if not combined_inputs:
+            # Nothing is consumed and can_add() already accepted the outputs,
+            # so there is nothing to snapshot or roll back.
+            inventory.add(outputs)
+            return True, combined_inputs, outputs, None, None
+
         before = {resource: inventory.get_amount(resource) for resource in touched}
 
-        if combined_inputs and not inventory.consume(combined_inputs):
+        if not inventory.consume(combined_inputs):
             self._restore_inventory(inventory, before)
             missing = self._first_missing_resource(combined_inputs, inventory)
             detail = missing.value if isinstance(missing, Resource) else None
@@ -476,6 +545,35 @@ class Building:
 
         return True, combined_inputs, outputs, None, None
 
+    def _cycle_plan(
+        self,
+    ) -> Tuple[
+        config.BuildingRecipe,
+        Dict[Resource, float],
+        Dict[Resource, float],
+        Dict[Resource, float],
+        Dict[Resource, float],
+        Tuple[Resource, ...],
+    ]:
+        """Return the per-cycle resource maps derived from the recipe.
+
+        They only depend on the recipe, so they are built once and reused by
+        every :meth:`_attempt_cycle` call instead of being copied per cycle.
+        Callers must treat the returned dictionaries as read-only.
+        """
+
+        plan = self._cycle_plan_cache
+        if plan is not None and plan[0] is self.recipe:
+            return plan
+        maintenance = dict(self.maintenance_per_cycle)
+        inputs = dict(self.inputs_per_cycle)
+        combined = self._combine_resources(inputs, maintenance)
+        outputs = dict(self.outputs_per_cycle)
+        touched = tuple(dict.fromkeys([*combined, *outputs]))
+        plan = (self.recipe, maintenance, inputs, combined, outputs, touched)
+        self._cycle_plan_cache = plan
+        return plan
+
     @staticmethod
     def _combine_resources(*dicts: Mapping[Resource, float]) -> Dict[Resource, float]:
         combined: Dict[Resource, float] = {}
@@ -487,11 +585,12 @@ class Building:
         return combined
 
     @staticmethod
-    def _accumulate(target: Dict[Resource, float], addition: Mapping[Resource, float]) -> None:
+    def _accumulate(target: Dict[str, float], addition: Mapping[Resource, float]) -> None:
         for resource, amount in addition.items():
             if amount <= 0:
                 continue
-            target[resource] = target.get(resource, 0.0) + amount
+            key = resource.value
+            target[key] = target.get(key, 0.0) + amount
 
     @staticmethod
     def _restore_inventory(inventory: Inventory, snapshot: Mapping[Resource, float]) -> None:
@@ -527,7 +626,59 @@ class Building:
         return None
 
     # ------------------------------------------------------------------
+    def _static_snapshot(self) -> Dict[str, object]:
+        """Return the snapshot fields derived only from the recipe and capacity.
+
+        The payload is rebuilt when the recipe object or ``max_workers`` changes.
+        """
+
+        recipe = self.recipe
+        max_workers = self.max_workers
+        cached = self._static_snapshot_cache
+        if cached is not None and cached[0] is recipe and cached[1] == max_workers:
+            return cached[2]
+
+        static: Dict[str, object] = {
+            "inputs": {res.value: amt for res, amt in self.inputs_per_cycle.items()},
+            "outputs": {res.value: amt for res, amt in self.outputs_per_cycle.items()},
+            "maintenance": {
+                res.value: amt for res, amt in self.maintenance_per_cycle.items()
+            },
+            "cost": {
+                res.value: amt
+                for res, amt in config.build_cost(self.type_key).items()
+            },
+        }
+
+        per_worker_outputs = self.per_worker_output_rate
+        if not per_worker_outputs and self.outputs_per_cycle and max_workers > 0:
+            per_worker_outputs = {
+                resource: amount / max_workers
+                for resource, amount in recipe.outputs_per_second.items()
+            }
+        if per_worker_outputs:
+            static["per_worker_output_rate"] = {
+                resource.value: float(amount)
+                for resource, amount in per_worker_outputs.items()
+            }
+
+        per_worker_inputs = self.per_worker_input_rate
+        if not per_worker_inputs and self.inputs_per_cycle and max_workers > 0:
+            per_worker_inputs = {
+                resource: amount / max_workers
+                for resource, amount in recipe.inputs_per_second.items()
+            }
+        if per_worker_inputs:
+            static["per_worker_input_rate"] = {
+                resource.value: float(amount)
+                for resource, amount in per_worker_inputs.items()
+            }
+
+        self._static_snapshot_cache = (recipe, max_workers, static)
+        return static
+
     def to_snapshot(self) -> Dict[str, object]:
+        static = self._static_snapshot()
         snapshot = {
             "id": self.id,
             "type": self.type_key,
@@ -539,19 +690,14 @@ class Building:
             "max_workers": self.max_workers,
             "capacityPerBuilding": self.capacity_per_building,
             "storage": {res.value: amt for res, amt in self.storage.items()},
-            "inputs": {res.value: amt for res, amt in self.inputs_per_cycle.items()},
-            "outputs": {res.value: amt for res, amt in self.outputs_per_cycle.items()},
+            "inputs": dict(static["inputs"]),
+            "outputs": dict(static["outputs"]),
             "cycle_time": self.cycle_time_sec,
-            "maintenance": {
-                res.value: amt for res, amt in self.maintenance_per_cycle.items()
-            },
+            "maintenance": dict(static["maintenance"]),
             "status": self.status,
             "enabled": self.enabled,
             "production_report": self.production_report,
-            "cost": {
-                res.value: amt
-                for res, amt in config.BUILD_COSTS.get(self.type_key, {}).items()
-            },
+            "cost": dict(static["cost"]),
             "category": self.category,
             "category_label": self.category_label,
             "icon": self.icon,
@@ -563,36 +709,16 @@ class Building:
             "level": int(self.level),
         }
 
-        per_worker_outputs = self.per_worker_output_rate
-        if not per_worker_outputs and self.outputs_per_cycle:
-            if self.max_workers > 0 and self.cycle_time_sec > 0:
-                per_worker_outputs = {
-                    resource: amount / self.cycle_time_sec / self.max_workers
-                    for resource, amount in self.outputs_per_cycle.items()
-                }
+        per_worker_outputs = static.get("per_worker_output_rate")
+        per_worker_inputs = static.get("per_worker_input_rate")
         if per_worker_outputs:
-            snapshot["per_worker_output_rate"] = {
-                resource.value: float(amount)
-                for resource, amount in per_worker_outputs.items()
-            }
-
-        per_worker_inputs = self.per_worker_input_rate
-        if not per_worker_inputs and self.inputs_per_cycle:
-            if self.max_workers > 0 and self.cycle_time_sec > 0:
-                per_worker_inputs = {
-                    resource: amount / self.cycle_time_sec / self.max_workers
-                    for resource, amount in self.inputs_per_cycle.items()
-                }
+            snapshot["per_worker_output_rate"] = dict(per_worker_outputs)
         if per_worker_inputs:
-            snapshot["per_worker_input_rate"] = {
-                resource.value: float(amount)
-                for resource, amount in per_worker_inputs.items()
-            }
-
-        if "per_worker_output_rate" in snapshot:
-            snapshot["outputs_per_worker"] = dict(snapshot["per_worker_output_rate"])
-        if "per_worker_input_rate" in snapshot:
-            snapshot["inputs_per_worker"] = dict(snapshot["per_worker_input_rate"])
+            snapshot["per_worker_input_rate"] = dict(per_worker_inputs)
+        if per_worker_outputs:
+            snapshot["outputs_per_worker"] = dict(per_worker_outputs)
+        if per_worker_inputs:
+            snapshot["inputs_per_worker"] = dict(per_worker_inputs)
         return snapshot
 
     def to_dict(self) -> Dict[str, object]:
@@ -611,11 +737,40 @@ class Building:
         _ = next_id  # pragma: no cover
 
 
+class ContinuousBuilding(Building):
+    """Building producing every tick from per-worker rates."""
+
+    def _tick_active(
+        self,
+        dt: float,
+        inventory: Inventory,
+        notify,
+        modifiers: Mapping[str, float] | float | None,
+        max_workers: int,
+    ) -> Dict[str, object]:
+        return self._tick_continuous_recorded(dt, inventory, notify, modifiers)
+
+
+class CycleBuilding(Building):
+    """Building converting inputs into outputs in discrete cycles."""
+
+    def _tick_active(
+        self,
+        dt: float,
+        inventory: Inventory,
+        notify,
+        modifiers: Mapping[str, float] | float | None,
+        max_workers: int,
+    ) -> Dict[str, object]:
+        return self._tick_cycle(dt, inventory, notify, modifiers, max_workers)
+
+
 def build_from_config(type_key: str) -> Building:
     recipe = config.BUILDING_RECIPES[type_key]
     name = config.BUILDING_NAMES.get(type_key, type_key.title())
     metadata = config.get_building_metadata(type_key)
-    return Building(
+    building_cls = ContinuousBuilding if recipe.per_worker_output_rate else CycleBuilding
+    return building_cls(
         type_key=type_key,
         recipe=recipe,
         name=name,
@@ -667,6 +822,22 @@ def _recipe_inputs(recipe: config.BuildingRecipe) -> Set[Resource]:
     return inputs
 
 
+def _tier_zero_recipe(
+    resource: Resource,
+    *,
+    base_rate: float = _DEFAULT_TIER_ZERO_RATE,
+    max_workers: int = _DEFAULT_TIER_ZERO_MAX_WORKERS,
+) -> config.BuildingRecipe:
+    return config.make_recipe(
+        inputs=None,
+        outputs={},
+        cycle_time=1.0,
+        max_workers=max_workers,
+        capacity={resource: _DEFAULT_TIER_ZERO_CAPACITY},
+        per_worker_output_rate={resource: base_rate},
+    )
+
+
 def _register_basic_extractor(
     type_key: str,
     resource: Resource,
@@ -678,33 +849,23 @@ def _register_basic_extractor(
     if type_key in config.BUILDING_RECIPES:
         return False
 
-    recipe = config.BuildingRecipe(
-        inputs={},
-        outputs={},
-        cycle_time=1.0,
-        max_workers=max_workers,
-        maintenance={},
-        capacity={resource: _DEFAULT_TIER_ZERO_CAPACITY},
-        per_worker_output_rate={resource: base_rate},
-        per_worker_input_rate=None,
-    )
+    recipe = _tier_zero_recipe(resource, base_rate=base_rate, max_workers=max_workers)
 
     display_name = name or type_key.replace("_", " ").title()
 
-    config.BUILDING_PUBLIC_IDS[type_key] = type_key
-    config._BUILDING_ID_LOOKUP[type_key] = type_key
-    config.BUILDING_NAMES[type_key] = display_name
-    if type_key not in config.BUILDING_METADATA:
-        config.BUILDING_METADATA[type_key] = config.BuildingMetadata(
+    config.register_building(
+        type_key,
+        recipe,
+        name=display_name,
+        metadata=config.BuildingMetadata(
             category="resource",
             category_label="Resource Extraction",
             icon="⛏️",
             build_label=display_name,
             role="resource_collector",
             level=1,
-        )
-    config.BUILD_COSTS[type_key] = config.BUILD_COSTS.get(type_key, {})
-    config.BUILDING_RECIPES[type_key] = recipe
+        ),
+    )
 
     logger.info(
         "Registrado extractor básico %s para el recurso %s", type_key, resource.value
@@ -723,16 +884,7 @@ def _ensure_named_base_extractor(resource: Resource, type_key: str) -> str:
         return type_key
 
     if _recipe_inputs(recipe):
-        config.BUILDING_RECIPES[type_key] = config.BuildingRecipe(
-            inputs={},
-            outputs={},
-            cycle_time=1.0,
-            max_workers=_DEFAULT_TIER_ZERO_MAX_WORKERS,
-            maintenance={},
-            capacity={resource: _DEFAULT_TIER_ZERO_CAPACITY},
-            per_worker_output_rate={resource: _DEFAULT_TIER_ZERO_RATE},
-            per_worker_input_rate=None,
-        )
+        config.register_building_recipe(type_key, _tier_zero_recipe(resource))
         logger.info(
             "Se reemplazó la receta de %s para cumplir con el extractor básico de %s",
             type_key,
@@ -1,7 +1,12 @@
 """Centralised configuration for the management game backend."""
 from __future__ import annotations
 
+import sys
+import threading
+import warnings
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Mapping, Optional, Tuple
 
 from .resources import ALL_RESOURCES, Resource, normalise_mapping
@@ -11,6 +16,44 @@ from .resources import ALL_RESOURCES, Resource, normalise_mapping
 
 TEST_PASSIVE_TICK: bool = True
 
+# ---------------------------------------------------------------------------
+# Read-only resource mappings
+
+# Shared read-only view used for every empty resource mapping.
+_EMPTY_MAPPING: Mapping[Resource, float] = MappingProxyType({})
+
+
+# Interned views keyed by their source items, plus the same views keyed by id so
+# an already-frozen view is recognised without rebuilding its key. Both tables
+# hold strong references: a view is never collected while its id is recorded,
+# so an id can never be reused by an unrelated mapping. Only configuration
+# tables are frozen, so the number of distinct views stays small.
+_FROZEN_VIEWS: Dict[Tuple[Tuple[Resource | str, float], ...], Mapping[Resource, float]] = {}
+_FROZEN_VIEWS_BY_ID: Dict[int, Mapping[Resource, float]] = {
+    id(_EMPTY_MAPPING): _EMPTY_MAPPING
+}
+
+
+def _freeze_mapping(mapping: Mapping[Resource | str, float]) -> Mapping[Resource, float]:
+    """Return a shared read-only normalised view of ``mapping``.
+
+    Identical mappings resolve to the same view; key order is preserved because
+    some consumers read the first entry (see ``Building.capacity_per_building``).
+    """
+
+    if not mapping:
+        return _EMPTY_MAPPING
+    if _FROZEN_VIEWS_BY_ID.get(id(mapping)) is mapping:
+        return mapping
+    items = tuple(mapping.items())
+    view = _FROZEN_VIEWS.get(items)
+    if view is None:
+        view = MappingProxyType(normalise_mapping(mapping))
+        _FROZEN_VIEWS[items] = view
+        _FROZEN_VIEWS_BY_ID[id(view)] = view
+    return view
+
+
 # ---------------------------------------------------------------------------
 # Building identifiers and normalisation helpers
 
@@ -84,102 +127,113 @@ STAINED_GLASS = "stained_glass"
 SHRINE = "shrine"
 GARDEN = "garden"
 
-BUILDING_PUBLIC_IDS: Dict[str, str] = {
-    WOODCUTTER_CAMP: "woodcutter_camp",
-    STICK_GATHERER: "stick_gatherer",
-    STICK_GATHERING_TENT: "stick_gathering_tent",
-    STONE_GATHERING_TENT: "stone_gathering_tent",
-    QUARRY: "quarry",
-    LUMBER_HUT: "lumber_hut",
-    MINER: "miner",
-    FARMER: "farmer",
-    ARTISAN: "artisan",
-    GOLD_PANNER: "gold_panner",
-    LUMBER_CAMP: "lumber_camp",
-    FORESTER_CAMP: "forester_camp",
-    SAWMILL: "sawmill",
-    BLACKSMITH: "blacksmith",
-    COOPERAGE: "cooperage",
-    STONECUTTER_CAMP: "stonecutter_camp",
-    STONEMASON_HUT: "stonemason_hut",
-    IRON_MINE: "iron_mine",
-    COAL_HUT: "coal_hut",
-    IRON_SMELTER: "iron_smelter",
-    GOLD_SMELTER: "gold_smelter",
-    GLASS_SMELTER: "glass_smelter",
-    GATHERING_HUT: "gathering_hut",
-    WHEAT_FARM: "wheat_farm",
-    WINDMILL: "windmill",
-    BAKERY: "bakery",
-    FISHERS_HUT: "fishers_hut",
-    HUNTERS_HUT: "hunters_hut",
-    DAIRY_FARM: "dairy_farm",
-    CHEESEMAKER: "cheesemaker",
-    HOP_FARM: "hop_farm",
-    BREWERY: "brewery",
-    WELL: "well",
-    WEAVERS_HUT: "weavers_hut",
-    TAILORS_WORKSHOP: "tailors_workshop",
-    CANDLE_WORKSHOP: "candle_workshop",
-    JEWELER_WORKSHOP: "jeweler_workshop",
-    APIARY: "apiary",
-    HERB_GARDEN: "herb_garden",
-    VINEYARD: "vineyard",
-    WINERY: "winery",
-    WAREHOUSE: "warehouse",
-    GRANARY: "granary",
-    MARKET_STALL: "market_stall",
-    MANOR_HOUSE: "manor_house",
-    TAX_OFFICE: "tax_office",
-    BAILIFF_OFFICE: "bailiff_office",
-    TAVERN: "tavern",
-    WOODEN_KEEP: "wooden_keep",
-    STONE_KEEP: "stone_keep",
-    BARRACKS: "barracks",
-    WEAPONSMITH: "weaponsmith",
-    SOLDIERS_TRAINING_GROUND: "soldiers_training_ground",
-    ARCHERS_TRAINING_GROUND: "archers_training_ground",
-    FOUNTAIN: "fountain",
-    GIANT_GATE: "giant_gate",
-    KNIGHT_STATUE: "knight_statue",
-    GOLDEN_CROSS: "golden_cross",
-    STAINED_GLASS: "stained_glass",
-    SHRINE: "shrine",
-    GARDEN: "garden",
-}
+_BUILDING_TYPES: Tuple[str, ...] = (
+    WOODCUTTER_CAMP,
+    STICK_GATHERER,
+    STICK_GATHERING_TENT,
+    STONE_GATHERING_TENT,
+    QUARRY,
+    LUMBER_HUT,
+    MINER,
+    FARMER,
+    ARTISAN,
+    GOLD_PANNER,
+    LUMBER_CAMP,
+    FORESTER_CAMP,
+    SAWMILL,
+    BLACKSMITH,
+    COOPERAGE,
+    STONECUTTER_CAMP,
+    STONEMASON_HUT,
+    IRON_MINE,
+    COAL_HUT,
+    IRON_SMELTER,
+    GOLD_SMELTER,
+    GLASS_SMELTER,
+    GATHERING_HUT,
+    WHEAT_FARM,
+    WINDMILL,
+    BAKERY,
+    FISHERS_HUT,
+    HUNTERS_HUT,
+    DAIRY_FARM,
+    CHEESEMAKER,
+    HOP_FARM,
+    BREWERY,
+    WELL,
+    WEAVERS_HUT,
+    TAILORS_WORKSHOP,
+    CANDLE_WORKSHOP,
+    JEWELER_WORKSHOP,
+    APIARY,
+    HERB_GARDEN,
+    VINEYARD,
+    WINERY,
+    WAREHOUSE,
+    GRANARY,
+    MARKET_STALL,
+    MANOR_HOUSE,
+    TAX_OFFICE,
+    BAILIFF_OFFICE,
+    TAVERN,
+    WOODEN_KEEP,
+    STONE_KEEP,
+    BARRACKS,
+    WEAPONSMITH,
+    SOLDIERS_TRAINING_GROUND,
+    ARCHERS_TRAINING_GROUND,
+    FOUNTAIN,
+    GIANT_GATE,
+    KNIGHT_STATUE,
+    GOLDEN_CROSS,
+    STAINED_GLASS,
+    SHRINE,
+    GARDEN,
+)
 
-_BUILDING_ID_LOOKUP: Dict[str, str] = {
-    public_id: type_key for type_key, public_id in BUILDING_PUBLIC_IDS.items()
-}
+# Public ids are the type keys themselves; this identity table is kept for
+# callers that still expect it and doubles as the set of known types.
+_BUILDING_PUBLIC_IDS: Dict[str, str] = {type_key: type_key for type_key in _BUILDING_TYPES}
+BUILDING_PUBLIC_IDS: Mapping[str, str] = MappingProxyType(_BUILDING_PUBLIC_IDS)
+
+
+def register_building_id(type_key: str) -> None:
+    """Register ``type_key`` as a known building."""
+
+    _BUILDING_PUBLIC_IDS[type_key] = type_key
 
 
 def normalise_building_key(value: str) -> str:
     if not isinstance(value, str):
         raise ValueError("El identificador de edificio debe ser una cadena")
+    if value in _BUILDING_PUBLIC_IDS:
+        return value
+    return _normalise_building_key(value)
+
+
+@lru_cache(maxsize=256)
+def _normalise_building_key(value: str) -> str:
     key = value.strip().lower().replace("-", "_")
     if not key:
         raise ValueError("El identificador de edificio está vacío")
-    return key
+    # Interned so lookups in the building tables short-circuit on identity.
+    return sys.intern(key)
 
 
 def resolve_building_type(value: str) -> str:
     key = normalise_building_key(value)
-    if key in BUILDING_PUBLIC_IDS:
+    if key in _BUILDING_PUBLIC_IDS:
         return key
-    mapped = _BUILDING_ID_LOOKUP.get(key)
-    if mapped:
-        return mapped
     raise ValueError(f"Identificador de edificio desconocido: {value}")
 
 
 def resolve_building_public_id(value: str) -> str:
-    type_key = resolve_building_type(value)
-    return BUILDING_PUBLIC_IDS[type_key]
+    return resolve_building_type(value)
 
 # ---------------------------------------------------------------------------
 # Building metadata
 
-BUILDING_NAMES: Dict[str, str] = {
+_BUILDING_NAMES: Dict[str, str] = {
     WOODCUTTER_CAMP: "Woodcutter Camp",
     STICK_GATHERER: "Stick Gatherer",
     STICK_GATHERING_TENT: "Stick-gathering Tent",
@@ -242,13 +296,11 @@ BUILDING_NAMES: Dict[str, str] = {
     SHRINE: "Shrine",
     GARDEN: "Garden",
 }
+BUILDING_NAMES: Mapping[str, str] = MappingProxyType(_BUILDING_NAMES)
 
-BUILD_COSTS: Dict[str, Dict[Resource, float]] = {
-    key: {} for key in BUILDING_PUBLIC_IDS
-}
-
-BUILD_COSTS.update(
-    {
+_BUILD_COSTS: Dict[str, Mapping[Resource, float]] = {
+    key: _freeze_mapping(cost)
+    for key, cost in {
         WOODCUTTER_CAMP: {Resource.WOOD: 10, Resource.GOLD: 5},
         STICK_GATHERER: {},
         STICK_GATHERING_TENT: {Resource.GOLD: 1},
@@ -310,11 +362,29 @@ BUILD_COSTS.update(
         STAINED_GLASS: {Resource.GLASS: 10, Resource.POLISHED_STONE: 4},
         SHRINE: {Resource.POLISHED_STONE: 8, Resource.WOOD: 6},
         GARDEN: {Resource.WOOD: 6, Resource.STONE: 4},
-    }
-)
+    }.items()
+}
+BUILD_COSTS: Mapping[str, Mapping[Resource, float]] = MappingProxyType(_BUILD_COSTS)
+
+
+def build_cost(type_key: str) -> Mapping[Resource, float]:
+    """Return the construction cost of ``type_key``; unknown keys are free."""
 
+    return _BUILD_COSTS.get(type_key, _EMPTY_MAPPING)
 
-@dataclass(frozen=True)
+
+@lru_cache(maxsize=256)
+def build_refund(type_key: str, rate: float) -> Mapping[Resource, float]:
+    """Return the resources refunded when demolishing ``type_key`` at ``rate``."""
+
+    if rate <= 0:
+        return _EMPTY_MAPPING
+    return _freeze_mapping(
+        {resource: amount * rate for resource, amount in build_cost(type_key).items()}
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class BuildingMetadata:
     """UI-centric metadata for building presentation."""
 
@@ -329,666 +399,707 @@ class BuildingMetadata:
     level: Optional[int] = None
 
 
-BUILDING_METADATA: Dict[str, BuildingMetadata] = {
-    WOODCUTTER_CAMP: BuildingMetadata(
-        category="wood",
-        category_label="Wood",
-        icon="🪓",
-        job="forester",
-        job_name="Forester",
-        job_icon="🌲",
-        build_label="Woodcutter Camp",
-        role="wood_producer",
-        level=2,
-    ),
-    STICK_GATHERER: BuildingMetadata(
-        category="wood",
-        category_label="Wood",
-        icon="🥢",
-        job="stick_gatherer",
-        job_name="Stick Gatherer",
-        job_icon="🥢",
-        build_label="Stick Gatherer",
-        role="stick_gatherer",
-        level=1,
-    ),
-    STICK_GATHERING_TENT: BuildingMetadata(
-        category="wood",
-        category_label="Wood",
-        icon="🥢",
-        job="stick_gatherer",
-        job_name="Stick Gatherer",
-        job_icon="🥢",
-        build_label="Stick-gathering Tent",
-        role="stick_gatherer",
-        level=1,
-    ),
-    STONE_GATHERING_TENT: BuildingMetadata(
-        category="stone",
-        category_label="Stone",
-        icon="🪨",
-        job="stone_gatherer",
-        job_name="Stone Gatherer",
-        job_icon="🪨",
-        build_label="Stone-gathering Tent",
-        role="stone_producer",
-        level=1,
-    ),
-    QUARRY: BuildingMetadata(
-        category="stone",
-        category_label="Stone",
-        icon="⛏️",
-        job="stone_gatherer",
-        job_name="Stone Gatherer",
-        job_icon="🪨",
-        build_label="Quarry",
-        role="stone_producer",
-        level=1,
-    ),
-    LUMBER_HUT: BuildingMetadata(
-        category="wood",
-        category_label="Wood",
-        icon="🏚️",
-        job="artisan",
-        job_name="Artisan",
-        job_icon="🛠️",
-        build_label="Lumber Hut",
-        role="plank_crafter",
-        level=3,
-    ),
-    MINER: BuildingMetadata(
-        category="stone",
-        category_label="Stone",
-        icon="⛏️",
-        job="miner",
-        job_name="Miner",
-        job_icon="⛏️",
-        build_label="Miner",
-        role="stone_producer",
-        level=3,
-    ),
-    FARMER: BuildingMetadata(
-        category="crops",
-        category_label="Crops",
-        icon="🌾",
-        job="farmer",
-        job_name="Farmer",
-        job_icon="🌾",
-        build_label="Farmer",
-        role="grain_producer",
-        level=2,
-    ),
-    ARTISAN: BuildingMetadata(
-        category="crops",
-        category_label="Crops",
-        icon="🛠️",
-        job="artisan",
-        job_name="Artisan",
-        job_icon="🛠️",
-        build_label="Artisan Workshop",
-        role="toolmaker",
-        level=4,
-    ),
-    GOLD_PANNER: BuildingMetadata(
-        category="stone",
-        category_label="Stone",
-        icon="🥇",
-        job="gold_panner",
-        job_name="Gold Panner",
-        job_icon="🥇",
-        build_label="Gold Panner",
-        role="gold_collector",
-        level=1,
-    ),
-    LUMBER_CAMP: BuildingMetadata(
-        category="wood_tools",
-        category_label="Wood & Tools",
-        icon="🪓",
-        job="woodcutter",
-        job_name="Woodcutter",
-        job_icon="🪓",
-        build_label="Lumber Camp",
-        role="wood_producer",
-        level=1,
-    ),
-    FORESTER_CAMP: BuildingMetadata(
-        category="wood_tools",
-        category_label="Wood & Tools",
-        icon="🌲",
-        job="forester",
-        job_name="Forester",
-        job_icon="🌲",
-        build_label="Forester Camp",
-        role="forestry",
-        level=1,
-    ),
-    SAWMILL: BuildingMetadata(
-        category="wood_tools",
-        category_label="Wood & Tools",
-        icon="🪵",
-        job="sawyer",
-        job_name="Sawyer",
-        job_icon="🪚",
-        build_label="Sawmill",
-        role="plank_crafter",
-        level=2,
-    ),
-    BLACKSMITH: BuildingMetadata(
-        category="wood_tools",
-        category_label="Wood & Tools",
-        icon="⚒️",
-        job="blacksmith",
-        job_name="Blacksmith",
-        job_icon="⚒️",
-        build_label="Blacksmith",
-        role="toolmaker",
-        level=3,
-    ),
-    COOPERAGE: BuildingMetadata(
-        category="wood_tools",
-        category_label="Wood & Tools",
-        icon="🛢️",
-        job="cooper",
-        job_name="Cooper",
-        job_icon="🛢️",
-        build_label="Cooperage",
-        role="barrel_maker",
-        level=3,
-    ),
-    STONECUTTER_CAMP: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="⛏️",
-        job="stonecutter",
-        job_name="Stonecutter",
-        job_icon="⛏️",
-        build_label="Stonecutter Camp",
-        role="stone_gatherer",
-        level=1,
-    ),
-    STONEMASON_HUT: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="🧱",
-        job="stonemason",
-        job_name="Stonemason",
-        job_icon="🧱",
-        build_label="Stonemason Hut",
-        role="stone_refiner",
-        level=2,
-    ),
-    IRON_MINE: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="⚒️",
-        job="miner",
-        job_name="Miner",
-        job_icon="⚒️",
-        build_label="Iron Mine",
-        role="iron_miner",
-        level=2,
-    ),
-    COAL_HUT: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="🔥",
-        job="coal_worker",
-        job_name="Coal Worker",
-        job_icon="🔥",
-        build_label="Coal Hut",
-        role="coal_maker",
-        level=1,
-    ),
-    IRON_SMELTER: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="🏭",
-        job="smelter",
-        job_name="Smelter",
-        job_icon="🏭",
-        build_label="Iron Smelter",
-        role="iron_smelter",
-        level=3,
-    ),
-    GOLD_SMELTER: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="🪙",
-        job="gold_smelter",
-        job_name="Gold Smelter",
-        job_icon="🪙",
-        build_label="Gold Smelter",
-        role="gold_smelter",
-        level=3,
-    ),
-    GLASS_SMELTER: BuildingMetadata(
-        category="minerals",
-        category_label="Minerals & Smelting",
-        icon="🔮",
-        job="glassblower",
-        job_name="Glassblower",
-        job_icon="🔮",
-        build_label="Glass Smelter",
-        role="glassmaker",
-        level=3,
-    ),
-    GATHERING_HUT: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🍓",
-        job="gatherer",
-        job_name="Gatherer",
-        job_icon="🍓",
-        build_label="Gathering Hut",
-        role="berry_gatherer",
-        level=1,
-    ),
-    WHEAT_FARM: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🌾",
-        job="farmer",
-        job_name="Farmer",
-        job_icon="🌾",
-        build_label="Wheat Farm",
-        role="grain_producer",
-        level=1,
-    ),
-    WINDMILL: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🌬️",
-        job="miller",
-        job_name="Miller",
-        job_icon="🌬️",
-        build_label="Windmill",
-        role="grain_processor",
-        level=2,
-    ),
-    BAKERY: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🥖",
-        job="baker",
-        job_name="Baker",
-        job_icon="🥖",
-        build_label="Bakery",
-        role="bread_maker",
-        level=2,
-    ),
-    FISHERS_HUT: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🎣",
-        job="fisher",
-        job_name="Fisher",
-        job_icon="🎣",
-        build_label="Fisher's Hut",
-        role="fish_producer",
-        level=1,
-    ),
-    HUNTERS_HUT: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🏹",
-        job="hunter",
-        job_name="Hunter",
-        job_icon="🏹",
-        build_label="Hunter's Hut",
-        role="meat_hunter",
-        level=1,
-    ),
-    DAIRY_FARM: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🐄",
-        job="dairyman",
-        job_name="Dairy Farmer",
-        job_icon="🐄",
-        build_label="Dairy Farm",
-        role="milk_producer",
-        level=2,
-    ),
-    CHEESEMAKER: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🧀",
-        job="cheesemaker",
-        job_name="Cheesemaker",
-        job_icon="🧀",
-        build_label="Cheesemaker",
-        role="cheese_maker",
-        level=2,
-    ),
-    HOP_FARM: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🌱",
-        job="hop_farmer",
-        job_name="Hop Farmer",
-        job_icon="🌱",
-        build_label="Hop Farm",
-        role="hop_producer",
-        level=1,
-    ),
-    BREWERY: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🍺",
-        job="brewer",
-        job_name="Brewer",
-        job_icon="🍺",
-        build_label="Brewery",
-        role="beer_maker",
-        level=3,
-    ),
-    WELL: BuildingMetadata(
-        category="food",
-        category_label="Basic Food & Farming",
-        icon="🚰",
-        job="water_carrier",
-        job_name="Water Carrier",
-        job_icon="🚰",
-        build_label="Well",
-        role="water_collector",
-        level=1,
-    ),
-    WEAVERS_HUT: BuildingMetadata(
-        category="luxury",
-        category_label="Clothing & Luxury",
-        icon="🧵",
-        job="weaver",
-        job_name="Weaver",
-        job_icon="🧵",
-        build_label="Weaver's Hut",
-        role="cloth_maker",
-        level=2,
-    ),
-    TAILORS_WORKSHOP: BuildingMetadata(
-        category="luxury",
-        category_label="Clothing & Luxury",
-        icon="👗",
-        job="tailor",
-        job_name="Tailor",
-        job_icon="👗",
-        build_label="Tailor's Workshop",
-        role="clothing_maker",
-        level=3,
-    ),
-    CANDLE_WORKSHOP: BuildingMetadata(
-        category="luxury",
-        category_label="Clothing & Luxury",
-        icon="🕯️",
-        job="candlemaker",
-        job_name="Candlemaker",
-        job_icon="🕯️",
-        build_label="Candle Workshop",
-        role="candle_maker",
-        level=3,
-    ),
-    JEWELER_WORKSHOP: BuildingMetadata(
-        category="luxury",
-        category_label="Clothing & Luxury",
-        icon="💍",
-        job="jeweler",
-        job_name="Jeweler",
-        job_icon="💍",
-        build_label="Jeweler Workshop",
-        role="jewelry_maker",
-        level=4,
-    ),
-    APIARY: BuildingMetadata(
-        category="monastery",
-        category_label="Monastery",
-        icon="🐝",
-        job="beekeeper",
-        job_name="Beekeeper",
-        job_icon="🐝",
-        build_label="Apiary",
-        role="honey_producer",
-        level=2,
-    ),
-    HERB_GARDEN: BuildingMetadata(
-        category="monastery",
-        category_label="Monastery",
-        icon="🌿",
-        job="herbalist",
-        job_name="Herbalist",
-        job_icon="🌿",
-        build_label="Herb Garden",
-        role="herb_grower",
-        level=1,
-    ),
-    VINEYARD: BuildingMetadata(
-        category="monastery",
-        category_label="Monastery",
-        icon="🍇",
-        job="vigneron",
-        job_name="Vigneron",
-        job_icon="🍇",
-        build_label="Vineyard",
-        role="grape_grower",
-        level=2,
-    ),
-    WINERY: BuildingMetadata(
-        category="monastery",
-        category_label="Monastery",
-        icon="🍷",
-        job="winemaker",
-        job_name="Winemaker",
-        job_icon="🍷",
-        build_label="Winery",
-        role="wine_maker",
-        level=3,
-    ),
-    WAREHOUSE: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="📦",
-        job="storekeeper",
-        job_name="Storekeeper",
-        job_icon="📦",
-        build_label="Warehouse",
-        role="storage",
-        level=2,
-    ),
-    GRANARY: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="🧺",
-        job="granary_keeper",
-        job_name="Granary Keeper",
-        job_icon="🧺",
-        build_label="Granary",
-        role="food_storage",
-        level=2,
-    ),
-    MARKET_STALL: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="🛒",
-        job="vendor",
-        job_name="Vendor",
-        job_icon="🛒",
-        build_label="Market Stall",
-        role="market",
-        level=1,
-    ),
-    MANOR_HOUSE: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="🏰",
-        job="lord",
-        job_name="Lord",
-        job_icon="🏰",
-        build_label="Manor House",
-        role="governance",
-        level=4,
-    ),
-    TAX_OFFICE: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="💰",
-        job="tax_collector",
-        job_name="Tax Collector",
-        job_icon="💰",
-        build_label="Tax Office",
-        role="taxation",
-        level=3,
-    ),
-    BAILIFF_OFFICE: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="⚖️",
-        job="bailiff",
-        job_name="Bailiff",
-        job_icon="⚖️",
-        build_label="Bailiff Office",
-        role="administration",
-        level=3,
-    ),
-    TAVERN: BuildingMetadata(
-        category="economy",
-        category_label="Economy & Governance",
-        icon="🍻",
-        job="innkeeper",
-        job_name="Innkeeper",
-        job_icon="🍻",
-        build_label="Tavern",
-        role="hospitality",
-        level=3,
-    ),
-    WOODEN_KEEP: BuildingMetadata(
-        category="army",
-        category_label="Army & Defense",
-        icon="🛡️",
-        job="guard",
-        job_name="Guard",
-        job_icon="🛡️",
-        build_label="Wooden Keep",
-        role="defense",
-        level=3,
-    ),
-    STONE_KEEP: BuildingMetadata(
-        category="army",
-        category_label="Army & Defense",
-        icon="🏯",
-        job="knight",
-        job_name="Knight",
-        job_icon="🏯",
-        build_label="Stone Keep",
-        role="defense",
-        level=4,
-    ),
-    BARRACKS: BuildingMetadata(
-        category="army",
-        category_label="Army & Defense",
-        icon="🪖",
-        job="trainer",
-        job_name="Drill Sergeant",
-        job_icon="🪖",
-        build_label="Barracks",
-        role="training",
-        level=3,
-    ),
-    WEAPONSMITH: BuildingMetadata(
-        category="army",
-        category_label="Army & Defense",
-        icon="⚔️",
-        job="weaponsmith",
-        job_name="Weaponsmith",
-        job_icon="⚔️",
-        build_label="Weaponsmith",
-        role="weapon_maker",
-        level=3,
-    ),
-    SOLDIERS_TRAINING_GROUND: BuildingMetadata(
-        category="army",
-        category_label="Army & Defense",
-        icon="🗡️",
-        job="soldier_trainer",
-        job_name="Soldier Trainer",
-        job_icon="🗡️",
-        build_label="Soldier's Training Ground",
-        role="soldier_training",
-        level=3,
-    ),
-    ARCHERS_TRAINING_GROUND: BuildingMetadata(
-        category="army",
-        category_label="Army & Defense",
-        icon="🎯",
-        job="archer_trainer",
-        job_name="Archer Trainer",
-        job_icon="🎯",
-        build_label="Archer's Training Ground",
-        role="archer_training",
-        level=3,
-    ),
-    FOUNTAIN: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="⛲",
-        build_label="Fountain",
-        role="decorative",
-        level=1,
-    ),
-    GIANT_GATE: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="🚪",
-        build_label="Giant Gate",
-        role="decorative",
-        level=2,
-    ),
-    KNIGHT_STATUE: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="🗿",
-        build_label="Knight Statue",
-        role="decorative",
-        level=2,
-    ),
-    GOLDEN_CROSS: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="✝️",
-        build_label="Golden Cross",
-        role="decorative",
-        level=2,
-    ),
-    STAINED_GLASS: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="🪟",
-        build_label="Stained Glass",
-        role="decorative",
-        level=2,
-    ),
-    SHRINE: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="🛐",
-        build_label="Shrine",
-        role="decorative",
-        level=1,
-    ),
-    GARDEN: BuildingMetadata(
-        category="decorative",
-        category_label="Decorative / Monumental",
-        icon="🌼",
-        build_label="Garden",
-        role="decorative",
-        level=1,
-    ),
-}
+def _build_metadata_table() -> Dict[str, BuildingMetadata]:
+    return {
+        WOODCUTTER_CAMP: BuildingMetadata(
+            category="wood",
+            category_label="Wood",
+            icon="🪓",
+            job="forester",
+            job_name="Forester",
+            job_icon="🌲",
+            build_label="Woodcutter Camp",
+            role="wood_producer",
+            level=2,
+        ),
+        STICK_GATHERER: BuildingMetadata(
+            category="wood",
+            category_label="Wood",
+            icon="🥢",
+            job="stick_gatherer",
+            job_name="Stick Gatherer",
+            job_icon="🥢",
+            build_label="Stick Gatherer",
+            role="stick_gatherer",
+            level=1,
+        ),
+        STICK_GATHERING_TENT: BuildingMetadata(
+            category="wood",
+            category_label="Wood",
+            icon="🥢",
+            job="stick_gatherer",
+            job_name="Stick Gatherer",
+            job_icon="🥢",
+            build_label="Stick-gathering Tent",
+            role="stick_gatherer",
+            level=1,
+        ),
+        STONE_GATHERING_TENT: BuildingMetadata(
+            category="stone",
+            category_label="Stone",
+            icon="🪨",
+            job="stone_gatherer",
+            job_name="Stone Gatherer",
+            job_icon="🪨",
+            build_label="Stone-gathering Tent",
+            role="stone_producer",
+            level=1,
+        ),
+        QUARRY: BuildingMetadata(
+            category="stone",
+            category_label="Stone",
+            icon="⛏️",
+            job="stone_gatherer",
+            job_name="Stone Gatherer",
+            job_icon="🪨",
+            build_label="Quarry",
+            role="stone_producer",
+            level=1,
+        ),
+        LUMBER_HUT: BuildingMetadata(
+            category="wood",
+            category_label="Wood",
+            icon="🏚️",
+            job="artisan",
+            job_name="Artisan",
+            job_icon="🛠️",
+            build_label="Lumber Hut",
+            role="plank_crafter",
+            level=3,
+        ),
+        MINER: BuildingMetadata(
+            category="stone",
+            category_label="Stone",
+            icon="⛏️",
+            job="miner",
+            job_name="Miner",
+            job_icon="⛏️",
+            build_label="Miner",
+            role="stone_producer",
+            level=3,
+        ),
+        FARMER: BuildingMetadata(
+            category="crops",
+            category_label="Crops",
+            icon="🌾",
+            job="farmer",
+            job_name="Farmer",
+            job_icon="🌾",
+            build_label="Farmer",
+            role="grain_producer",
+            level=2,
+        ),
+        ARTISAN: BuildingMetadata(
+            category="crops",
+            category_label="Crops",
+            icon="🛠️",
+            job="artisan",
+            job_name="Artisan",
+            job_icon="🛠️",
+            build_label="Artisan Workshop",
+            role="toolmaker",
+            level=4,
+        ),
+        GOLD_PANNER: BuildingMetadata(
+            category="stone",
+            category_label="Stone",
+            icon="🥇",
+            job="gold_panner",
+            job_name="Gold Panner",
+            job_icon="🥇",
+            build_label="Gold Panner",
+            role="gold_collector",
+            level=1,
+        ),
+        LUMBER_CAMP: BuildingMetadata(
+            category="wood_tools",
+            category_label="Wood & Tools",
+            icon="🪓",
+            job="woodcutter",
+            job_name="Woodcutter",
+            job_icon="🪓",
+            build_label="Lumber Camp",
+            role="wood_producer",
+            level=1,
+        ),
+        FORESTER_CAMP: BuildingMetadata(
+            category="wood_tools",
+            category_label="Wood & Tools",
+            icon="🌲",
+            job="forester",
+            job_name="Forester",
+            job_icon="🌲",
+            build_label="Forester Camp",
+            role="forestry",
+            level=1,
+        ),
+        SAWMILL: BuildingMetadata(
+            category="wood_tools",
+            category_label="Wood & Tools",
+            icon="🪵",
+            job="sawyer",
+            job_name="Sawyer",
+            job_icon="🪚",
+            build_label="Sawmill",
+            role="plank_crafter",
+            level=2,
+        ),
+        BLACKSMITH: BuildingMetadata(
+            category="wood_tools",
+            category_label="Wood & Tools",
+            icon="⚒️",
+            job="blacksmith",
+            job_name="Blacksmith",
+            job_icon="⚒️",
+            build_label="Blacksmith",
+            role="toolmaker",
+            level=3,
+        ),
+        COOPERAGE: BuildingMetadata(
+            category="wood_tools",
+            category_label="Wood & Tools",
+            icon="🛢️",
+            job="cooper",
+            job_name="Cooper",
+            job_icon="🛢️",
+            build_label="Cooperage",
+            role="barrel_maker",
+            level=3,
+        ),
+        STONECUTTER_CAMP: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="⛏️",
+            job="stonecutter",
+            job_name="Stonecutter",
+            job_icon="⛏️",
+            build_label="Stonecutter Camp",
+            role="stone_gatherer",
+            level=1,
+        ),
+        STONEMASON_HUT: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="🧱",
+            job="stonemason",
+            job_name="Stonemason",
+            job_icon="🧱",
+            build_label="Stonemason Hut",
+            role="stone_refiner",
+            level=2,
+        ),
+        IRON_MINE: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="⚒️",
+            job="miner",
+            job_name="Miner",
+            job_icon="⚒️",
+            build_label="Iron Mine",
+            role="iron_miner",
+            level=2,
+        ),
+        COAL_HUT: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="🔥",
+            job="coal_worker",
+            job_name="Coal Worker",
+            job_icon="🔥",
+            build_label="Coal Hut",
+            role="coal_maker",
+            level=1,
+        ),
+        IRON_SMELTER: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="🏭",
+            job="smelter",
+            job_name="Smelter",
+            job_icon="🏭",
+            build_label="Iron Smelter",
+            role="iron_smelter",
+            level=3,
+        ),
+        GOLD_SMELTER: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="🪙",
+            job="gold_smelter",
+            job_name="Gold Smelter",
+            job_icon="🪙",
+            build_label="Gold Smelter",
+            role="gold_smelter",
+            level=3,
+        ),
+        GLASS_SMELTER: BuildingMetadata(
+            category="minerals",
+            category_label="Minerals & Smelting",
+            icon="🔮",
+            job="glassblower",
+            job_name="Glassblower",
+            job_icon="🔮",
+            build_label="Glass Smelter",
+            role="glassmaker",
+            level=3,
+        ),
+        GATHERING_HUT: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🍓",
+            job="gatherer",
+            job_name="Gatherer",
+            job_icon="🍓",
+            build_label="Gathering Hut",
+            role="berry_gatherer",
+            level=1,
+        ),
+        WHEAT_FARM: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🌾",
+            job="farmer",
+            job_name="Farmer",
+            job_icon="🌾",
+            build_label="Wheat Farm",
+            role="grain_producer",
+            level=1,
+        ),
+        WINDMILL: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🌬️",
+            job="miller",
+            job_name="Miller",
+            job_icon="🌬️",
+            build_label="Windmill",
+            role="grain_processor",
+            level=2,
+        ),
+        BAKERY: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🥖",
+            job="baker",
+            job_name="Baker",
+            job_icon="🥖",
+            build_label="Bakery",
+            role="bread_maker",
+            level=2,
+        ),
+        FISHERS_HUT: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🎣",
+            job="fisher",
+            job_name="Fisher",
+            job_icon="🎣",
+            build_label="Fisher's Hut",
+            role="fish_producer",
+            level=1,
+        ),
+        HUNTERS_HUT: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🏹",
+            job="hunter",
+            job_name="Hunter",
+            job_icon="🏹",
+            build_label="Hunter's Hut",
+            role="meat_hunter",
+            level=1,
+        ),
+        DAIRY_FARM: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🐄",
+            job="dairyman",
+            job_name="Dairy Farmer",
+            job_icon="🐄",
+            build_label="Dairy Farm",
+            role="milk_producer",
+            level=2,
+        ),
+        CHEESEMAKER: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🧀",
+            job="cheesemaker",
+            job_name="Cheesemaker",
+            job_icon="🧀",
+            build_label="Cheesemaker",
+            role="cheese_maker",
+            level=2,
+        ),
+        HOP_FARM: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🌱",
+            job="hop_farmer",
+            job_name="Hop Farmer",
+            job_icon="🌱",
+            build_label="Hop Farm",
+            role="hop_producer",
+            level=1,
+        ),
+        BREWERY: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🍺",
+            job="brewer",
+            job_name="Brewer",
+            job_icon="🍺",
+            build_label="Brewery",
+            role="beer_maker",
+            level=3,
+        ),
+        WELL: BuildingMetadata(
+            category="food",
+            category_label="Basic Food & Farming",
+            icon="🚰",
+            job="water_carrier",
+            job_name="Water Carrier",
+            job_icon="🚰",
+            build_label="Well",
+            role="water_collector",
+            level=1,
+        ),
+        WEAVERS_HUT: BuildingMetadata(
+            category="luxury",
+            category_label="Clothing & Luxury",
+            icon="🧵",
+            job="weaver",
+            job_name="Weaver",
+            job_icon="🧵",
+            build_label="Weaver's Hut",
+            role="cloth_maker",
+            level=2,
+        ),
+        TAILORS_WORKSHOP: BuildingMetadata(
+            category="luxury",
+            category_label="Clothing & Luxury",
+            icon="👗",
+            job="tailor",
+            job_name="Tailor",
+            job_icon="👗",
+            build_label="Tailor's Workshop",
+            role="clothing_maker",
+            level=3,
+        ),
+        CANDLE_WORKSHOP: BuildingMetadata(
+            category="luxury",
+            category_label="Clothing & Luxury",
+            icon="🕯️",
+            job="candlemaker",
+            job_name="Candlemaker",
+            job_icon="🕯️",
+            build_label="Candle Workshop",
+            role="candle_maker",
+            level=3,
+        ),
+        JEWELER_WORKSHOP: BuildingMetadata(
+            category="luxury",
+            category_label="Clothing & Luxury",
+            icon="💍",
+            job="jeweler",
+            job_name="Jeweler",
+            job_icon="💍",
+            build_label="Jeweler Workshop",
+            role="jewelry_maker",
+            level=4,
+        ),
+        APIARY: BuildingMetadata(
+            category="monastery",
+            category_label="Monastery",
+            icon="🐝",
+            job="beekeeper",
+            job_name="Beekeeper",
+            job_icon="🐝",
+            build_label="Apiary",
+            role="honey_producer",
+            level=2,
+        ),
+        HERB_GARDEN: BuildingMetadata(
+            category="monastery",
+            category_label="Monastery",
+            icon="🌿",
+            job="herbalist",
+            job_name="Herbalist",
+            job_icon="🌿",
+            build_label="Herb Garden",
+            role="herb_grower",
+            level=1,
+        ),
+        VINEYARD: BuildingMetadata(
+            category="monastery",
+            category_label="Monastery",
+            icon="🍇",
+            job="vigneron",
+            job_name="Vigneron",
+            job_icon="🍇",
+            build_label="Vineyard",
+            role="grape_grower",
+            level=2,
+        ),
+        WINERY: BuildingMetadata(
+            category="monastery",
+            category_label="Monastery",
+            icon="🍷",
+            job="winemaker",
+            job_name="Winemaker",
+            job_icon="🍷",
+            build_label="Winery",
+            role="wine_maker",
+            level=3,
+        ),
+        WAREHOUSE: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="📦",
+            job="storekeeper",
+            job_name="Storekeeper",
+            job_icon="📦",
+            build_label="Warehouse",
+            role="storage",
+            level=2,
+        ),
+        GRANARY: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="🧺",
+            job="granary_keeper",
+            job_name="Granary Keeper",
+            job_icon="🧺",
+            build_label="Granary",
+            role="food_storage",
+            level=2,
+        ),
+        MARKET_STALL: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="🛒",
+            job="vendor",
+            job_name="Vendor",
+            job_icon="🛒",
+            build_label="Market Stall",
+            role="market",
+            level=1,
+        ),
+        MANOR_HOUSE: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="🏰",
+            job="lord",
+            job_name="Lord",
+            job_icon="🏰",
+            build_label="Manor House",
+            role="governance",
+            level=4,
+        ),
+        TAX_OFFICE: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="💰",
+            job="tax_collector",
+            job_name="Tax Collector",
+            job_icon="💰",
+            build_label="Tax Office",
+            role="taxation",
+            level=3,
+        ),
+        BAILIFF_OFFICE: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="⚖️",
+            job="bailiff",
+            job_name="Bailiff",
+            job_icon="⚖️",
+            build_label="Bailiff Office",
+            role="administration",
+            level=3,
+        ),
+        TAVERN: BuildingMetadata(
+            category="economy",
+            category_label="Economy & Governance",
+            icon="🍻",
+            job="innkeeper",
+            job_name="Innkeeper",
+            job_icon="🍻",
+            build_label="Tavern",
+            role="hospitality",
+            level=3,
+        ),
+        WOODEN_KEEP: BuildingMetadata(
+            category="army",
+            category_label="Army & Defense",
+            icon="🛡️",
+            job="guard",
+            job_name="Guard",
+            job_icon="🛡️",
+            build_label="Wooden Keep",
+            role="defense",
+            level=3,
+        ),
+        STONE_KEEP: BuildingMetadata(
+            category="army",
+            category_label="Army & Defense",
+            icon="🏯",
+            job="knight",
+            job_name="Knight",
+            job_icon="🏯",
+            build_label="Stone Keep",
+            role="defense",
+            level=4,
+        ),
+        BARRACKS: BuildingMetadata(
+            category="army",
+            category_label="Army & Defense",
+            icon="🪖",
+            job="trainer",
+            job_name="Drill Sergeant",
+            job_icon="🪖",
+            build_label="Barracks",
+            role="training",
+            level=3,
+        ),
+        WEAPONSMITH: BuildingMetadata(
+            category="army",
+            category_label="Army & Defense",
+            icon="⚔️",
+            job="weaponsmith",
+            job_name="Weaponsmith",
+            job_icon="⚔️",
+            build_label="Weaponsmith",
+            role="weapon_maker",
+            level=3,
+        ),
+        SOLDIERS_TRAINING_GROUND: BuildingMetadata(
+            category="army",
+            category_label="Army & Defense",
+            icon="🗡️",
+            job="soldier_trainer",
+            job_name="Soldier Trainer",
+            job_icon="🗡️",
+            build_label="Soldier's Training Ground",
+            role="soldier_training",
+            level=3,
+        ),
+        ARCHERS_TRAINING_GROUND: BuildingMetadata(
+            category="army",
+            category_label="Army & Defense",
+            icon="🎯",
+            job="archer_trainer",
+            job_name="Archer Trainer",
+            job_icon="🎯",
+            build_label="Archer's Training Ground",
+            role="archer_training",
+            level=3,
+        ),
+        FOUNTAIN: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="⛲",
+            build_label="Fountain",
+            role="decorative",
+            level=1,
+        ),
+        GIANT_GATE: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="🚪",
+            build_label="Giant Gate",
+            role="decorative",
+            level=2,
+        ),
+        KNIGHT_STATUE: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="🗿",
+            build_label="Knight Statue",
+            role="decorative",
+            level=2,
+        ),
+        GOLDEN_CROSS: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="✝️",
+            build_label="Golden Cross",
+            role="decorative",
+            level=2,
+        ),
+        STAINED_GLASS: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="🪟",
+            build_label="Stained Glass",
+            role="decorative",
+            level=2,
+        ),
+        SHRINE: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="🛐",
+            build_label="Shrine",
+            role="decorative",
+            level=1,
+        ),
+        GARDEN: BuildingMetadata(
+            category="decorative",
+            category_label="Decorative / Monumental",
+            icon="🌼",
+            build_label="Garden",
+            role="decorative",
+            level=1,
+        ),
+    }
+
+
+# Presentation metadata is only needed by UI payloads, so the table above is
+# built on first use. Buildings registered before then wait in
+# ``_PENDING_METADATA`` and are merged in when the table is built.
+_BUILDING_METADATA: Optional[Dict[str, BuildingMetadata]] = None
+_PENDING_METADATA: Dict[str, BuildingMetadata] = {}
+_METADATA_LOCK = threading.Lock()
+
+
+def _metadata_table() -> Dict[str, BuildingMetadata]:
+    global _BUILDING_METADATA
+    table = _BUILDING_METADATA
+    if table is not None:
+        return table
+    with _METADATA_LOCK:
+        if _BUILDING_METADATA is None:
+            table = _build_metadata_table()
+            for type_key, metadata in _PENDING_METADATA.items():
+                table.setdefault(type_key, metadata)
+            _PENDING_METADATA.clear()
+            _BUILDING_METADATA = table
+        return _BUILDING_METADATA
+
+
+def register_building_metadata(type_key: str, metadata: BuildingMetadata) -> None:
+    """Record ``metadata`` for ``type_key`` unless it already has an entry."""
+
+    with _METADATA_LOCK:
+        table = _BUILDING_METADATA
+        if table is None:
+            _PENDING_METADATA.setdefault(type_key, metadata)
+        else:
+            table.setdefault(type_key, metadata)
+    _fallback_metadata.cache_clear()
 
 
 def get_building_metadata(type_key: str) -> BuildingMetadata:
     """Return the metadata for ``type_key`` with sensible defaults."""
 
-    meta = BUILDING_METADATA.get(type_key)
+    meta = _metadata_table().get(type_key)
     if meta is not None:
         return meta
+    return _fallback_metadata(type_key)
+
+
+@lru_cache(maxsize=None)
+def _fallback_metadata(type_key: str) -> BuildingMetadata:
     name = BUILDING_NAMES.get(type_key, type_key.title())
     return BuildingMetadata(
         category="general",
@@ -1000,10 +1111,8 @@ def get_building_metadata(type_key: str) -> BuildingMetadata:
         build_label=name,
     )
 
-# Backwards compatibility alias for legacy references.
-COSTOS_CONSTRUCCION: Dict[str, Dict[Resource, float]] = BUILD_COSTS
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BuildingRecipe:
     """Structure describing how a building converts resources each cycle."""
 
@@ -1012,12 +1121,43 @@ class BuildingRecipe:
     cycle_time: float
     max_workers: int
     capacity: Optional[Mapping[Resource, float]] = None
-    maintenance: Mapping[Resource, float] = field(default_factory=dict)
+    maintenance: Mapping[Resource, float] = field(default_factory=lambda: _EMPTY_MAPPING)
     per_worker_output_rate: Optional[Mapping[Resource, float]] = None
     per_worker_input_rate: Optional[Mapping[Resource, float]] = None
+    # Per-cycle amounts divided by ``cycle_time``; empty when it is not positive.
+    inputs_per_second: Mapping[Resource, float] = field(
+        init=False, repr=False, compare=False
+    )
+    outputs_per_second: Mapping[Resource, float] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "inputs_per_second", _per_second(self.inputs, self.cycle_time)
+        )
+        object.__setattr__(
+            self, "outputs_per_second", _per_second(self.outputs, self.cycle_time)
+        )
+
 
+def _per_second(
+    amounts: Mapping[Resource, float], cycle_time: float
+) -> Mapping[Resource, float]:
+    if cycle_time <= 0 or not amounts:
+        return _EMPTY_MAPPING
+    return _freeze_mapping(
+        {resource: amount / cycle_time for resource, amount in amounts.items()}
+    )
+
+
+def _freeze_optional(
+    mapping: Mapping[Resource | str, float] | None,
+) -> Optional[Mapping[Resource, float]]:
+    return None if mapping is None else _freeze_mapping(mapping)
 
-def _recipe(
+
+def make_recipe(
     *,
     inputs: Mapping[Resource, float] | None,
     outputs: Mapping[Resource, float],
@@ -1028,24 +1168,23 @@ def _recipe(
     per_worker_output_rate: Mapping[Resource, float] | None = None,
     per_worker_input_rate: Mapping[Resource, float] | None = None,
 ) -> BuildingRecipe:
+    """Build a :class:`BuildingRecipe` with read-only, shared resource mappings."""
+
+    freeze = _freeze_mapping
     return BuildingRecipe(
-        inputs=normalise_mapping(inputs or {}),
-        outputs=normalise_mapping(outputs),
+        inputs=freeze(inputs) if inputs else _EMPTY_MAPPING,
+        outputs=freeze(outputs),
         cycle_time=float(cycle_time),
         max_workers=int(max_workers),
-        capacity=None if capacity is None else normalise_mapping(capacity),
-        maintenance=normalise_mapping(maintenance or {}),
-        per_worker_output_rate=None
-        if per_worker_output_rate is None
-        else normalise_mapping(per_worker_output_rate),
-        per_worker_input_rate=None
-        if per_worker_input_rate is None
-        else normalise_mapping(per_worker_input_rate),
+        capacity=_freeze_optional(capacity),
+        maintenance=freeze(maintenance) if maintenance else _EMPTY_MAPPING,
+        per_worker_output_rate=_freeze_optional(per_worker_output_rate),
+        per_worker_input_rate=_freeze_optional(per_worker_input_rate),
     )
 
 
-BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
-    STICK_GATHERER: _recipe(
+_BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
+    STICK_GATHERER: make_recipe(
         inputs={},
         outputs={},
         cycle_time=1.0,
@@ -1054,7 +1193,7 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
         per_worker_output_rate={Resource.STICKS: 0.1},
         capacity={Resource.STICKS: 100},
     ),
-    STICK_GATHERING_TENT: _recipe(
+    STICK_GATHERING_TENT: make_recipe(
         inputs={},
         outputs={},
         cycle_time=1.0,
@@ -1063,7 +1202,7 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
         per_worker_output_rate={Resource.STICKS: 0.01},
         capacity={Resource.STICKS: 30},
     ),
-    STONE_GATHERING_TENT: _recipe(
+    STONE_GATHERING_TENT: make_recipe(
         inputs={},
         outputs={},
         cycle_time=1.0,
@@ -1072,7 +1211,7 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
         per_worker_output_rate={Resource.STONE: 0.01},
         capacity={Resource.STONE: 30},
     ),
-    QUARRY: _recipe(
+    QUARRY: make_recipe(
         inputs={},
         outputs={},
         cycle_time=1.0,
@@ -1081,7 +1220,7 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
         per_worker_output_rate={Resource.STONE: 0.1},
         capacity={Resource.STONE: 100},
     ),
-    GOLD_PANNER: _recipe(
+    GOLD_PANNER: make_recipe(
         inputs={},
         outputs={},
         cycle_time=1.0,
@@ -1090,7 +1229,7 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
         per_worker_output_rate={Resource.GOLD: 0.1},
         capacity={Resource.GOLD: 100},
     ),
-    WOODCUTTER_CAMP: _recipe(
+    WOODCUTTER_CAMP: make_recipe(
         inputs={},
         outputs={},
         cycle_time=1.0,
@@ -1103,369 +1242,369 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
         },
         capacity={Resource.WOOD: 30},
     ),
-    LUMBER_HUT: _recipe(
+    LUMBER_HUT: make_recipe(
         inputs={Resource.WOOD: 2},
         outputs={Resource.PLANK: 1},
         cycle_time=4.0,
         max_workers=2,
         maintenance={Resource.GOLD: 0.006666666666666667},
     ),
-    MINER: _recipe(
+    MINER: make_recipe(
         inputs={},
         outputs={Resource.STONE: 1, Resource.ORE: 0.2},
         cycle_time=5.0,
         max_workers=3,
         maintenance={Resource.GOLD: 0.016666666666666666},
     ),
-    FARMER: _recipe(
+    FARMER: make_recipe(
         inputs={Resource.SEEDS: 1},
         outputs={Resource.GRAIN: 3},
         cycle_time=8.0,
         max_workers=3,
         maintenance={Resource.GOLD: 0.0125},
     ),
-    ARTISAN: _recipe(
+    ARTISAN: make_recipe(
         inputs={Resource.PLANK: 1, Resource.STONE: 1},
         outputs={Resource.TOOLS: 1},
         cycle_time=6.0,
         max_workers=2,
         maintenance={Resource.GOLD: 0.01},
     ),
-    LUMBER_CAMP: _recipe(
+    LUMBER_CAMP: make_recipe(
         inputs={},
         outputs={Resource.WOOD: 6},
         cycle_time=60.0,
         max_workers=3,
         capacity={Resource.WOOD: 120},
     ),
-    FORESTER_CAMP: _recipe(
+    FORESTER_CAMP: make_recipe(
         inputs={},
         outputs={},
         cycle_time=90.0,
         max_workers=2,
     ),
-    SAWMILL: _recipe(
+    SAWMILL: make_recipe(
         inputs={Resource.WOOD: 4},
         outputs={Resource.PLANK: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.PLANK: 80},
     ),
-    BLACKSMITH: _recipe(
+    BLACKSMITH: make_recipe(
         inputs={Resource.IRON: 2, Resource.COAL: 2},
         outputs={Resource.TOOLS: 2},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.TOOLS: 60},
     ),
-    COOPERAGE: _recipe(
+    COOPERAGE: make_recipe(
         inputs={Resource.PLANK: 2, Resource.IRON: 1, Resource.TOOLS: 1},
         outputs={Resource.BARRELS: 2},
         cycle_time=75.0,
         max_workers=2,
         capacity={Resource.BARRELS: 40},
     ),
-    STONECUTTER_CAMP: _recipe(
+    STONECUTTER_CAMP: make_recipe(
         inputs={},
         outputs={Resource.STONE: 6},
         cycle_time=60.0,
         max_workers=3,
         capacity={Resource.STONE: 120},
     ),
-    STONEMASON_HUT: _recipe(
+    STONEMASON_HUT: make_recipe(
         inputs={Resource.STONE: 4},
         outputs={Resource.POLISHED_STONE: 2},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.POLISHED_STONE: 60},
     ),
-    IRON_MINE: _recipe(
+    IRON_MINE: make_recipe(
         inputs={},
         outputs={Resource.IRON_ORE: 6},
         cycle_time=60.0,
         max_workers=3,
         capacity={Resource.IRON_ORE: 120},
     ),
-    COAL_HUT: _recipe(
+    COAL_HUT: make_recipe(
         inputs={Resource.WOOD: 4},
         outputs={Resource.COAL: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.COAL: 80},
     ),
-    IRON_SMELTER: _recipe(
+    IRON_SMELTER: make_recipe(
         inputs={Resource.IRON_ORE: 4, Resource.COAL: 2},
         outputs={Resource.IRON: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.IRON: 80},
     ),
-    GOLD_SMELTER: _recipe(
+    GOLD_SMELTER: make_recipe(
         inputs={Resource.GOLD_ORE: 4, Resource.COAL: 2},
         outputs={Resource.GOLD: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.GOLD: 80},
     ),
-    GLASS_SMELTER: _recipe(
+    GLASS_SMELTER: make_recipe(
         inputs={Resource.QUARTZ: 4, Resource.COAL: 2},
         outputs={Resource.GLASS: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.GLASS: 80},
     ),
-    GATHERING_HUT: _recipe(
+    GATHERING_HUT: make_recipe(
         inputs={},
         outputs={Resource.BERRIES: 6},
         cycle_time=60.0,
         max_workers=3,
         capacity={Resource.BERRIES: 100},
     ),
-    WHEAT_FARM: _recipe(
+    WHEAT_FARM: make_recipe(
         inputs={},
         outputs={Resource.WHEAT: 6},
         cycle_time=60.0,
         max_workers=3,
         capacity={Resource.WHEAT: 120},
     ),
-    WINDMILL: _recipe(
+    WINDMILL: make_recipe(
         inputs={Resource.WHEAT: 4},
         outputs={Resource.FLOUR: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.FLOUR: 80},
     ),
-    BAKERY: _recipe(
+    BAKERY: make_recipe(
         inputs={Resource.FLOUR: 3, Resource.WATER: 2},
         outputs={Resource.BREAD: 5},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.BREAD: 60},
     ),
-    FISHERS_HUT: _recipe(
+    FISHERS_HUT: make_recipe(
         inputs={},
         outputs={Resource.FISH: 5},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.FISH: 100},
     ),
-    HUNTERS_HUT: _recipe(
+    HUNTERS_HUT: make_recipe(
         inputs={},
         outputs={Resource.BOAR_MEAT: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.BOAR_MEAT: 80},
     ),
-    DAIRY_FARM: _recipe(
+    DAIRY_FARM: make_recipe(
         inputs={},
         outputs={Resource.MILK: 5},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.MILK: 90},
     ),
-    CHEESEMAKER: _recipe(
+    CHEESEMAKER: make_recipe(
         inputs={Resource.MILK: 4},
         outputs={Resource.CHEESE: 3},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.CHEESE: 60},
     ),
-    HOP_FARM: _recipe(
+    HOP_FARM: make_recipe(
         inputs={},
         outputs={Resource.HOPS: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.HOPS: 80},
     ),
-    BREWERY: _recipe(
+    BREWERY: make_recipe(
         inputs={Resource.WHEAT: 2, Resource.HOPS: 2, Resource.WATER: 3},
         outputs={Resource.BEER: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.BEER: 60},
     ),
-    WELL: _recipe(
+    WELL: make_recipe(
         inputs={},
         outputs={Resource.WATER: 6},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.WATER: 120},
     ),
-    WEAVERS_HUT: _recipe(
+    WEAVERS_HUT: make_recipe(
         inputs={Resource.WOOL: 4},
         outputs={Resource.CLOTH: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.CLOTH: 70},
     ),
-    TAILORS_WORKSHOP: _recipe(
+    TAILORS_WORKSHOP: make_recipe(
         inputs={Resource.CLOTH: 3},
         outputs={Resource.CLOTHES: 3},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.CLOTHES: 60},
     ),
-    CANDLE_WORKSHOP: _recipe(
+    CANDLE_WORKSHOP: make_recipe(
         inputs={Resource.WAX: 2, Resource.IRON: 1, Resource.TOOLS: 1},
         outputs={Resource.CANDLES: 3},
         cycle_time=75.0,
         max_workers=2,
         capacity={Resource.CANDLES: 60},
     ),
-    JEWELER_WORKSHOP: _recipe(
+    JEWELER_WORKSHOP: make_recipe(
         inputs={Resource.GOLD: 2, Resource.GEMS: 2},
         outputs={Resource.JEWELRY: 2},
         cycle_time=75.0,
         max_workers=1,
         capacity={Resource.JEWELRY: 50},
     ),
-    APIARY: _recipe(
+    APIARY: make_recipe(
         inputs={},
         outputs={Resource.HONEY: 4, Resource.WAX: 2},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.HONEY: 60, Resource.WAX: 40},
     ),
-    HERB_GARDEN: _recipe(
+    HERB_GARDEN: make_recipe(
         inputs={},
         outputs={Resource.HERBS: 4},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.HERBS: 80},
     ),
-    VINEYARD: _recipe(
+    VINEYARD: make_recipe(
         inputs={},
         outputs={Resource.GRAPES: 5},
         cycle_time=60.0,
         max_workers=3,
         capacity={Resource.GRAPES: 90},
     ),
-    WINERY: _recipe(
+    WINERY: make_recipe(
         inputs={Resource.GRAPES: 4},
         outputs={Resource.WINE: 3},
         cycle_time=60.0,
         max_workers=2,
         capacity={Resource.WINE: 60},
     ),
-    WAREHOUSE: _recipe(
+    WAREHOUSE: make_recipe(
         inputs={},
         outputs={},
         cycle_time=60.0,
         max_workers=2,
     ),
-    GRANARY: _recipe(
+    GRANARY: make_recipe(
         inputs={},
         outputs={},
         cycle_time=60.0,
         max_workers=2,
     ),
-    MARKET_STALL: _recipe(
+    MARKET_STALL: make_recipe(
         inputs={Resource.BERRIES: 2, Resource.BREAD: 1, Resource.CHEESE: 1},
         outputs={Resource.HAPPINESS: 4, Resource.GOLD: 2},
         cycle_time=60.0,
         max_workers=2,
     ),
-    MANOR_HOUSE: _recipe(
+    MANOR_HOUSE: make_recipe(
         inputs={},
         outputs={},
         cycle_time=90.0,
         max_workers=1,
     ),
-    TAX_OFFICE: _recipe(
+    TAX_OFFICE: make_recipe(
         inputs={Resource.HAPPINESS: 2},
         outputs={Resource.GOLD: 3},
         cycle_time=90.0,
         max_workers=2,
     ),
-    BAILIFF_OFFICE: _recipe(
+    BAILIFF_OFFICE: make_recipe(
         inputs={},
         outputs={},
         cycle_time=90.0,
         max_workers=1,
     ),
-    TAVERN: _recipe(
+    TAVERN: make_recipe(
         inputs={Resource.BEER: 2, Resource.BREAD: 1},
         outputs={Resource.HAPPINESS: 6},
         cycle_time=60.0,
         max_workers=3,
     ),
-    WOODEN_KEEP: _recipe(
+    WOODEN_KEEP: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    STONE_KEEP: _recipe(
+    STONE_KEEP: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    BARRACKS: _recipe(
+    BARRACKS: make_recipe(
         inputs={Resource.WEAPONS: 1},
         outputs={Resource.SOLDIER: 1},
         cycle_time=90.0,
         max_workers=2,
         capacity={Resource.SOLDIER: 40},
     ),
-    WEAPONSMITH: _recipe(
+    WEAPONSMITH: make_recipe(
         inputs={Resource.IRON: 2, Resource.COAL: 1, Resource.TOOLS: 1},
         outputs={Resource.WEAPONS: 3},
         cycle_time=75.0,
         max_workers=2,
         capacity={Resource.WEAPONS: 60},
     ),
-    SOLDIERS_TRAINING_GROUND: _recipe(
+    SOLDIERS_TRAINING_GROUND: make_recipe(
         inputs={Resource.WEAPONS: 2},
         outputs={Resource.SOLDIER: 2},
         cycle_time=90.0,
         max_workers=2,
         capacity={Resource.SOLDIER: 40},
     ),
-    ARCHERS_TRAINING_GROUND: _recipe(
+    ARCHERS_TRAINING_GROUND: make_recipe(
         inputs={Resource.WEAPONS: 2},
         outputs={Resource.ARCHER: 2},
         cycle_time=90.0,
         max_workers=2,
         capacity={Resource.ARCHER: 40},
     ),
-    FOUNTAIN: _recipe(
+    FOUNTAIN: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    GIANT_GATE: _recipe(
+    GIANT_GATE: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    KNIGHT_STATUE: _recipe(
+    KNIGHT_STATUE: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    GOLDEN_CROSS: _recipe(
+    GOLDEN_CROSS: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    STAINED_GLASS: _recipe(
+    STAINED_GLASS: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    SHRINE: _recipe(
+    SHRINE: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
         max_workers=0,
     ),
-    GARDEN: _recipe(
+    GARDEN: make_recipe(
         inputs={},
         outputs={},
         cycle_time=120.0,
@@ -1473,7 +1612,78 @@ BUILDING_RECIPES: Dict[str, BuildingRecipe] = {
     ),
 }
 
-TRADE_DEFAULTS: Dict[Resource, Dict[str, float | str]] = {
+BUILDING_RECIPES: Mapping[str, BuildingRecipe] = MappingProxyType(_BUILDING_RECIPES)
+
+
+def register_building_recipe(type_key: str, recipe: BuildingRecipe) -> None:
+    """Add or replace the recipe used for ``type_key``."""
+
+    _BUILDING_RECIPES[type_key] = recipe
+    _resource_flows.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _resource_flows() -> Tuple[
+    Mapping[Resource, Tuple[str, ...]], Mapping[Resource, Tuple[str, ...]]
+]:
+    producers: Dict[Resource, list] = {}
+    consumers: Dict[Resource, list] = {}
+    for type_key, recipe in _BUILDING_RECIPES.items():
+        for index, mappings in (
+            (producers, (recipe.outputs, recipe.per_worker_output_rate)),
+            (consumers, (recipe.inputs, recipe.per_worker_input_rate)),
+        ):
+            resources = {
+                resource
+                for mapping in mappings
+                if mapping
+                for resource, amount in mapping.items()
+                if amount > 0
+            }
+            for resource in resources:
+                index.setdefault(resource, []).append(type_key)
+    return (
+        MappingProxyType({res: tuple(keys) for res, keys in producers.items()}),
+        MappingProxyType({res: tuple(keys) for res, keys in consumers.items()}),
+    )
+
+
+def producers_of(resource: Resource) -> Tuple[str, ...]:
+    """Return the building types whose recipe outputs ``resource``.
+
+    The reverse index is built once from :data:`BUILDING_RECIPES` and rebuilt
+    after :func:`register_building_recipe` changes the table.
+    """
+
+    return _resource_flows()[0].get(resource, ())
+
+
+def consumers_of(resource: Resource) -> Tuple[str, ...]:
+    """Return the building types whose recipe consumes ``resource``."""
+
+    return _resource_flows()[1].get(resource, ())
+
+
+def register_building(
+    type_key: str,
+    recipe: BuildingRecipe,
+    *,
+    name: str,
+    metadata: BuildingMetadata,
+) -> None:
+    """Register a building created at runtime in every configuration table.
+
+    ``metadata`` is only used when ``type_key`` has no metadata yet; the build
+    cost defaults to free through :func:`build_cost`.
+    """
+
+    register_building_id(type_key)
+    _BUILDING_NAMES[type_key] = name
+    register_building_metadata(type_key, metadata)
+    register_building_recipe(type_key, recipe)
+
+
+_TRADE_DEFAULTS: Dict[Resource, Dict[str, float | str]] = {
     Resource.WOOD: {"mode": "pause", "rate": 0.0, "price": 1.0},
     Resource.STICKS: {"mode": "pause", "rate": 0.0, "price": 0.5},
     Resource.STONE: {"mode": "pause", "rate": 0.0, "price": 1.5},
@@ -1487,7 +1697,11 @@ TRADE_DEFAULTS: Dict[Resource, Dict[str, float | str]] = {
     Resource.HOPS: {"mode": "pause", "rate": 0.0, "price": 2.5},
 }
 
-CAPACIDADES: Dict[Resource, float] = {
+TRADE_DEFAULTS: Mapping[Resource, Mapping[str, float | str]] = MappingProxyType(
+    {resource: MappingProxyType(info) for resource, info in _TRADE_DEFAULTS.items()}
+)
+
+_CAPACIDADES: Dict[Resource, float] = {
     Resource.WOOD: 500,
     Resource.PLANK: 300,
     Resource.BARRELS: 150,
@@ -1531,15 +1745,15 @@ CAPACIDADES: Dict[Resource, float] = {
     Resource.SEEDS: 200,
 }
 
+CAPACIDADES: Mapping[Resource, float] = MappingProxyType(_CAPACIDADES)
+
 # Population configuration
 POPULATION_INITIAL: int = 4
 POPULATION_CAPACITY: int = 20
 
-WORKERS_INICIALES: int = POPULATION_INITIAL
-
-STARTING_RESOURCES: Dict[Resource, float] = {
-    resource: 10.0 for resource in ALL_RESOURCES
-}
+STARTING_RESOURCES: Mapping[Resource, float] = MappingProxyType(
+    dict.fromkeys(ALL_RESOURCES, 10.0)
+)
 
 STARTING_BUILDINGS: Tuple[Mapping[str, object], ...] = (
     {
@@ -1585,3 +1799,25 @@ SEASON_MODIFIERS: Dict[str, Dict[str, float]] = {
 }
 
 NOTIFICATION_QUEUE_LIMIT = 50
+
+
+# Backwards compatibility aliases for legacy references, resolved on access.
+_LEGACY_ALIASES: Dict[str, str] = {
+    "COSTOS_CONSTRUCCION": "BUILD_COSTS",
+    "WORKERS_INICIALES": "POPULATION_INITIAL",
+}
+
+
+def __getattr__(name: str) -> object:
+    target = _LEGACY_ALIASES.get(name)
+    if target is not None:
+        warnings.warn(
+            f"{name} está obsoleto; usa {target}", DeprecationWarning, stacklevel=2
+        )
+        # Bind the alias so the warning is only emitted on first access.
+        value = globals()[name] = globals()[target]
+        return value
+    if name == "BUILDING_METADATA":
+        value = globals()[name] = MappingProxyType(_metadata_table())
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
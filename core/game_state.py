@@ -28,6 +28,12 @@ from .trade import TradeManager
 
 logger = logging.getLogger(__name__)
 
+# ``(resource, value, lowercase value)`` for every resource, so snapshot builders
+# do not re-read the enum ``value`` descriptor per resource on every call.
+_RESOURCE_KEYS: Tuple[Tuple[Resource, str, str], ...] = tuple(
+    (resource, resource.value, resource.value.lower()) for resource in ALL_RESOURCES
+)
+
 
 class InsufficientResourcesError(Exception):
     """Raised when an action cannot be performed due to missing resources."""
@@ -51,6 +57,8 @@ class GameState:
         self._tick_count = 0
         self._state_version = 0
         self.notifications: Deque[str] = deque(maxlen=config.NOTIFICATION_QUEUE_LIMIT)
+        # Occurrence count per queued message, kept in step with ``notifications``.
+        self._notification_counts: Dict[str, int] = {}
         self.last_production_reports: Dict[str, Dict[str, object]] = {}
         self._active_missing_notifications: Dict[Tuple[str, Resource], str] = {}
         self.wood: float = 0.0
@@ -59,6 +67,7 @@ class GameState:
         self.max_workers_woodcutter: int = 0
         self.wood_max_capacity: float = 0.0
         self.wood_production_per_second: float = 0.0
+        self._wood_rates_cache: Optional[Tuple[object, Tuple[float, float, float]]] = None
         self._initialise_state()
 
     # ------------------------------------------------------------------
@@ -76,6 +85,7 @@ class GameState:
             self._tick_count = 0
             self._state_version = 0
             self.notifications.clear()
+            self._notification_counts.clear()
 
             now = 0.0
             self.time = {"server_now": float(now), "last_tick": float(now)}
@@ -125,12 +135,14 @@ class GameState:
 
     # ------------------------------------------------------------------
     def _initialise_inventory(self) -> None:
+        inventory = self.inventory
+        starting = config.STARTING_RESOURCES
+        capacities = config.CAPACIDADES
         for resource in ALL_RESOURCES:
-            amount = config.STARTING_RESOURCES.get(resource, 0.0)
-            self.inventory.set_amount(resource, float(amount))
-            capacity = config.CAPACIDADES.get(resource)
+            inventory.set_amount(resource, float(starting.get(resource, 0.0)))
+            capacity = capacities.get(resource)
             if capacity is not None:
-                self.inventory.set_capacity(resource, float(capacity))
+                inventory.set_capacity(resource, float(capacity))
 
     @staticmethod
     def _normalise_built_value(value: object, *, default: int = 0) -> int:
@@ -231,12 +243,30 @@ class GameState:
                 self.population["cap"] = self.population_capacity
 
     def add_notification(self, message: str) -> None:
-        self.notifications.append(message)
+        with self._lock:
+            notifications = self.notifications
+            if len(notifications) == notifications.maxlen:
+                self._forget_notification(notifications[0])
+            notifications.append(message)
+            counts = self._notification_counts
+            counts[message] = counts.get(message, 0) + 1
 
     def consume_notification(self) -> Optional[str]:
-        if not self.notifications:
-            return None
-        return self.notifications.popleft()
+        with self._lock:
+            if not self.notifications:
+                return None
+            message = self.notifications.popleft()
+            self._forget_notification(message)
+            return message
+
+    def _forget_notification(self, message: str) -> None:
+        with self._lock:
+            counts = self._notification_counts
+            remaining = counts.get(message, 0) - 1
+            if remaining > 0:
+                counts[message] = remaining
+            else:
+                counts.pop(message, None)
 
     def list_notifications(self) -> List[str]:
         return list(self.notifications)
@@ -327,7 +357,7 @@ class GameState:
         if config.TEST_PASSIVE_TICK and seconds > 0:
             passive_gain = 0.1 * seconds
             if passive_gain > 0:
-                additions = {resource: passive_gain for resource in ALL_RESOURCES}
+                additions = dict.fromkeys(ALL_RESOURCES, passive_gain)
                 self.inventory.add(additions)
                 self.resources["gold"] = self.inventory.get_amount(Resource.GOLD)
 
@@ -339,8 +369,8 @@ class GameState:
         for building in list(self.buildings.values()):
             if woodcutter_building is not None and building.id == woodcutter_building.id:
                 continue
-            modifiers = self.get_production_modifiers(building)
-            report = building.tick(seconds, self.inventory, self.add_notification, modifiers)
+            multiplier = self.season_clock.get_multiplier(building.type_key)
+            report = building.tick(seconds, self.inventory, self.add_notification, multiplier)
             self.last_production_reports[building.id] = report
             self._update_missing_input_notifications(building, report, active_missing)
         self._cleanup_missing_notifications(active_missing)
@@ -401,9 +431,9 @@ class GameState:
             self.last_production_reports[woodcutter_building.id] = wood_report
         with self._lock:
             self._tick_count += 1
-            if self._tick_count % 5 == 0:
+            if self._tick_count % 5 == 0 and logger.isEnabledFor(logging.DEBUG):
                 wood_amount = self.inventory.get_amount(Resource.WOOD)
-                woodcutter = self.get_building_by_type(config.WOODCUTTER_CAMP)
+                woodcutter = woodcutter_building
                 workers = woodcutter.assigned_workers if woodcutter else 0
                 built = woodcutter.built_count if woodcutter else 0
                 logger.debug(
@@ -427,9 +457,8 @@ class GameState:
         with self._lock:
             building = self.buildings.get(canonical_id)
 
-            cost = config.BUILD_COSTS.get(type_key, {})
-            if cost and not self.inventory.has(cost):
-                raise InsufficientResourcesError(cost)
+            cost = config.build_cost(type_key)
+            # consume() checks availability itself before taking anything.
             if cost and not self.inventory.consume(cost):
                 raise InsufficientResourcesError(cost)
 
@@ -481,13 +510,7 @@ class GameState:
             if building.type_key == config.WOODCUTTER_CAMP:
                 effective_refund_rate = 0.0
 
-            if effective_refund_rate > 0:
-                refund = {
-                    resource: amount * effective_refund_rate
-                    for resource, amount in config.BUILD_COSTS.get(building.type_key, {}).items()
-                }
-            else:
-                refund = {}
+            refund = config.build_refund(building.type_key, effective_refund_rate)
             if refund:
                 self.inventory.add(refund)
 
@@ -580,6 +603,10 @@ class GameState:
         return self.buildings.get(canonical_id)
 
     def get_building_by_type(self, type_key: str) -> Optional[Building]:
+        # Buildings are stored under their public id, which is the type key.
+        building = self.buildings.get(type_key)
+        if building is not None and building.type_key == type_key:
+            return building
         for building in self.buildings.values():
             if building.type_key == type_key:
                 return building
@@ -601,11 +628,10 @@ class GameState:
 
     def basic_state_snapshot(self) -> Dict[str, object]:
         with self._lock:
+            quantities = self.inventory.quantities
             items = {
-                resource.value.lower(): round(
-                    self.inventory.get_amount(resource), 1
-                )
-                for resource in ALL_RESOURCES
+                key: round(quantities.get(resource, 0.0), 1)
+                for resource, _, key in _RESOURCE_KEYS
             }
             woodcutter = self.get_building_by_type(config.WOODCUTTER_CAMP)
             population = self.population_snapshot()
@@ -736,12 +762,7 @@ class GameState:
                     self._state_version += 1
                 return result
 
-            wood_recipe = config.BUILDING_RECIPES[config.WOODCUTTER_CAMP]
-            per_worker_outputs = wood_recipe.per_worker_output_rate or {}
-            per_worker_inputs = wood_recipe.per_worker_input_rate or {}
-            output_rate = float(per_worker_outputs.get(Resource.WOOD, 0.0))
-            sticks_rate = float(per_worker_inputs.get(Resource.STICKS, 0.0))
-            stone_rate = float(per_worker_inputs.get(Resource.STONE, 0.0))
+            output_rate, sticks_rate, stone_rate = self._woodcutter_rates()
 
             if output_rate <= 0:
                 if changed:
@@ -818,10 +839,7 @@ class GameState:
             residual = self.inventory.add({Resource.WOOD: produced_amount})
             if residual:
                 if consumption:
-                    for resource, amount in consumption.items():
-                        self.inventory.set_amount(
-                            resource, self.inventory.get_amount(resource) + amount
-                        )
+                    self.inventory.credit(consumption)
                 result["reason"] = "no_capacity"
                 if changed:
                     self._state_version += 1
@@ -840,6 +858,26 @@ class GameState:
                 self._state_version += 1
         return result
 
+    def _woodcutter_rates(self) -> Tuple[float, float, float]:
+        """Return the woodcutter per-worker ``(wood, sticks, stone)`` rates.
+
+        The rates are cached until the woodcutter recipe is replaced.
+        """
+
+        wood_recipe = config.BUILDING_RECIPES[config.WOODCUTTER_CAMP]
+        cached = self._wood_rates_cache
+        if cached is not None and cached[0] is wood_recipe:
+            return cached[1]
+        per_worker_outputs = wood_recipe.per_worker_output_rate or {}
+        per_worker_inputs = wood_recipe.per_worker_input_rate or {}
+        rates = (
+            float(per_worker_outputs.get(Resource.WOOD, 0.0)),
+            float(per_worker_inputs.get(Resource.STICKS, 0.0)),
+            float(per_worker_inputs.get(Resource.STONE, 0.0)),
+        )
+        self._wood_rates_cache = (wood_recipe, rates)
+        return rates
+
     def _recompute_wood_state_locked(self) -> bool:
         """Synchronise derived wood values.
 
@@ -890,12 +928,7 @@ class GameState:
             self.inventory.set_amount(Resource.WOOD, 0.0)
         self.wood = current_amount
 
-        wood_recipe = config.BUILDING_RECIPES[config.WOODCUTTER_CAMP]
-        per_worker_output = 0.0
-        if wood_recipe.per_worker_output_rate:
-            per_worker_output = float(
-                wood_recipe.per_worker_output_rate.get(Resource.WOOD, 0.0)
-            )
+        per_worker_output = self._woodcutter_rates()[0]
         rate = assigned * per_worker_output if built > 0 else 0.0
         self.wood_production_per_second = rate
 
@@ -910,15 +943,17 @@ class GameState:
 
     # ------------------------------------------------------------------
     def snapshot_hud(self) -> Dict[str, object]:
+        quantities = self.inventory.quantities
+        capacities = self.inventory.capacities
         return {
             "season": self.season_snapshot,
             "resources": [
                 {
-                    "key": resource.value,
-                    "amount": self.inventory.get_amount(resource),
-                    "capacity": self.inventory.get_capacity(resource),
+                    "key": value,
+                    "amount": quantities.get(resource, 0.0),
+                    "capacity": capacities.get(resource),
                 }
-                for resource in ALL_RESOURCES
+                for resource, value, _ in _RESOURCE_KEYS
             ],
             "warnings": list(self.notifications),
         }
@@ -1004,10 +1039,8 @@ class GameState:
         return self.inventory.snapshot()
 
     def resources_snapshot(self) -> Dict[str, float]:
-        return {
-            resource.value: self.inventory.get_amount(resource)
-            for resource in ALL_RESOURCES
-        }
+        quantities = self.inventory.quantities
+        return {value: quantities.get(resource, 0.0) for resource, value, _ in _RESOURCE_KEYS}
 
     def snapshot_village_design(self) -> Dict[str, object]:
         with self._lock:
@@ -1121,8 +1154,8 @@ class GameState:
     # ------------------------------------------------------------------
     def _build_building_snapshot(self, building: Building) -> Dict[str, object]:
         snapshot = building.to_snapshot()
-        modifiers = self.get_production_modifiers(building)
-        effective_rate = building.effective_rate(building.assigned_workers, modifiers)
+        multiplier = self.season_clock.get_multiplier(building.type_key)
+        effective_rate = building.effective_rate(building.assigned_workers, multiplier)
         modifier_payload = self.season_clock.modifiers_payload(building.type_key)
         modifier_payload["total_multiplier"] = float(modifier_payload["total_multiplier"])
         can_produce, reason = self._building_can_produce(building, effective_rate)
@@ -1225,15 +1258,21 @@ class GameState:
         return message
 
     def _enqueue_unique_notification(self, message: str) -> None:
-        if message in self.notifications:
+        if message in self._notification_counts:
             return
-        self.notifications.append(message)
+        self.add_notification(message)
 
     def _remove_notification_message(self, message: str) -> None:
-        try:
-            self.notifications.remove(message)
-        except ValueError:
-            pass
+        with self._lock:
+            if message not in self._notification_counts:
+                return
+            try:
+                self.notifications.remove(message)
+            except ValueError:
+                # The count is stale; drop it so the message can be queued again.
+                self._notification_counts.pop(message, None)
+                return
+            self._forget_notification(message)
 
     def _building_pending_eta(self, building: Building, effective_rate: float) -> Optional[float]:
         if effective_rate <= 0:
@@ -1244,26 +1283,23 @@ class GameState:
     def _building_can_produce(
         self, building: Building, effective_rate: float
     ) -> Tuple[bool, Optional[str]]:
-        inactive_reason = building._inactive_reason()
+        inactive_reason = building._inactive_reason(building.max_workers)
         if inactive_reason:
             return False, inactive_reason
 
         if effective_rate <= 0:
             return False, "inactive"
 
-        maintenance = dict(building.maintenance_per_cycle)
-        inputs = dict(building.inputs_per_cycle)
+        _, maintenance, inputs, combined, outputs, _ = building._cycle_plan()
 
         if maintenance and not self.inventory.has(maintenance):
             return False, "missing_maintenance"
         if inputs and not self.inventory.has(inputs):
             return False, "missing_input"
 
-        combined = Building._combine_resources(inputs, maintenance)
         if combined and not self.inventory.has(combined):
             return False, "missing_input"
 
-        outputs = dict(building.outputs_per_cycle)
         if outputs and not self.inventory.can_add(outputs):
             return False, "no_capacity"
 
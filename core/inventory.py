@@ -27,7 +27,7 @@ class Inventory:
     def __post_init__(self) -> None:
         for resource in ALL_RESOURCES:
             self.quantities.setdefault(resource, 0.0)
-        self._reserved: Dict[Resource, float] = {resource: 0.0 for resource in ALL_RESOURCES}
+        self._reserved: Dict[Resource, float] = dict.fromkeys(ALL_RESOURCES, 0.0)
 
     # Utility methods -------------------------------------------------
     def _notify(self, message: str) -> None:
@@ -163,12 +163,24 @@ class Inventory:
                 self._notify(f"Almacén lleno para {resource.value}")
         return residual
 
+    def credit(self, resources: Dict[Resource, float]) -> None:
+        """Return ``resources`` to storage without applying capacity limits.
+
+        Used to refund consumed inputs when a production step has to be undone.
+        """
+
+        quantities = self.quantities
+        for resource, amount in resources.items():
+            quantities[resource] = max(0.0, quantities.get(resource, 0.0) + amount)
+
     def snapshot(self) -> Dict[str, Dict[str, float | None]]:
         data: Dict[str, Dict[str, float | None]] = {}
+        quantities = self.quantities
+        capacities = self.capacities
         for resource in ALL_RESOURCES:
             data[resource.value] = {
-                "amount": self.get_amount(resource),
-                "capacity": self.get_capacity(resource),
+                "amount": quantities.get(resource, 0.0),
+                "capacity": capacities.get(resource),
             }
         return data
 
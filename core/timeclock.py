@@ -29,6 +29,18 @@ class SeasonClock:
             season: {str(key): float(value) for key, value in modifiers.items()}
             for season, modifiers in (season_modifiers or {}).items()
         }
+        # Combined ``global * building`` multiplier per season and building tag;
+        # the "global" entry doubles as the fallback for untagged buildings.
+        self._season_multipliers: Dict[str, Dict[str, float]] = {}
+        for season, modifiers in self._season_modifiers.items():
+            global_value = modifiers.get("global", 1.0)
+            combined = {
+                key: global_value * value
+                for key, value in modifiers.items()
+                if key != "global"
+            }
+            combined["global"] = global_value
+            self._season_multipliers[season] = combined
 
     # ------------------------------------------------------------------
     def update(self, dt: float) -> None:
@@ -78,6 +90,18 @@ class SeasonClock:
             modifiers[building_tag] = float(season_modifiers.get(building_tag, 1.0))
         return modifiers
 
+    def get_multiplier(self, building_tag: str | None = None) -> float:
+        """Return the product of :meth:`get_modifiers` as a single factor."""
+
+        multipliers = self._season_multipliers.get(self.get_current_season())
+        if multipliers is None:
+            return 1.0
+        if building_tag:
+            value = multipliers.get(building_tag)
+            if value is not None:
+                return value
+        return multipliers["global"]
+
     def modifiers_payload(self, building_tag: str | None = None) -> Dict[str, object]:
         """Return UI-friendly data describing the modifiers applied."""
 
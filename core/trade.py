@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, Mapping
 
 from .inventory import Inventory
 from .resources import Resource
@@ -86,7 +86,7 @@ class TradeChannel:
 class TradeManager:
     """Manages trade channels for all resources."""
 
-    def __init__(self, defaults: Dict[Resource, Dict[str, float | str]]) -> None:
+    def __init__(self, defaults: Mapping[Resource, Mapping[str, float | str]]) -> None:
         self.channels: Dict[Resource, TradeChannel] = {}
         for resource, info in defaults.items():
             self.channels[resource] = TradeChannel(
@@ -98,6 +98,9 @@ class TradeManager:
 
     def tick(self, dt: float, inventory: Inventory, notify) -> None:
         for channel in self.channels.values():
+            # Every channel starts paused; skip them without a method call.
+            if channel.mode == "pause":
+                continue
             channel.tick(dt, inventory, notify)
 
     def get_channel(self, resource: Resource) -> TradeChannel:
@@ -215,3 +215,43 @@ def test_stone_tent_produces_stone():
     after = state.inventory.get_amount(Resource.STONE)
     passive_gain = 0.1 * 10.0
     assert after - before - passive_gain == pytest.approx(0.1, rel=1e-9, abs=1e-9)
+
+
+def test_get_building_by_type_returns_registered_building():
+    state = get_game_state()
+    woodcutter = state.get_building_by_type(config.WOODCUTTER_CAMP)
+    assert woodcutter is not None
+    assert woodcutter.type_key == config.WOODCUTTER_CAMP
+    assert state.get_building_by_type("unknown_building") is None
+
+
+def test_notification_queue_keeps_latest_messages_in_order():
+    state = get_game_state()
+    while state.consume_notification() is not None:
+        pass
+
+    limit = config.NOTIFICATION_QUEUE_LIMIT
+    for index in range(limit + 1):
+        state.add_notification(f"aviso {index}")
+
+    expected = [f"aviso {index}" for index in range(1, limit + 1)]
+    assert state.list_notifications() == expected
+    assert [state.consume_notification() for _ in range(limit)] == expected
+    assert state.consume_notification() is None
+
+
+def test_notification_can_be_queued_again_after_consume():
+    state = get_game_state()
+    while state.consume_notification() is not None:
+        pass
+
+    state.add_notification("Aserradero parado: falta Wood")
+    state.add_notification("Aserradero parado: falta Wood")
+    assert state.consume_notification() == "Aserradero parado: falta Wood"
+    assert state.list_notifications() == ["Aserradero parado: falta Wood"]
+
+    assert state.consume_notification() == "Aserradero parado: falta Wood"
+    assert state.list_notifications() == []
+
+    state.add_notification("Aserradero parado: falta Wood")
+    assert state.list_notifications() == ["Aserradero parado: falta Wood"]
@@ -1,3 +1,4 @@
+import subprocess
 import sys
 from pathlib import Path
 
@@ -6,9 +7,10 @@ import pytest
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from core import config
-from core.buildings import build_from_config
+from core.buildings import ContinuousBuilding, CycleBuilding, build_from_config
 from core.inventory import Inventory
 from core.resources import Resource
+from core.timeclock import SeasonClock
 
 
 def _inventory_with_capacities() -> Inventory:
@@ -126,3 +128,182 @@ def test_multiple_instances_scale_production():
     assert inventory.get_amount(Resource.BEER) == pytest.approx(8.0)
     assert inventory.get_amount(Resource.WHEAT) == pytest.approx(16.0)
     assert inventory.get_amount(Resource.HOPS) == pytest.approx(16.0)
+
+
+def test_inventory_credit_ignores_capacity():
+    inventory = _inventory_with_capacities()
+    inventory.set_amount(Resource.WOOD, config.CAPACIDADES[Resource.WOOD])
+
+    inventory.credit({Resource.WOOD: 5.0, Resource.STONE: 2.0})
+
+    assert inventory.get_amount(Resource.WOOD) == pytest.approx(
+        config.CAPACIDADES[Resource.WOOD] + 5.0
+    )
+    assert inventory.get_amount(Resource.STONE) == pytest.approx(2.0)
+
+
+def test_build_from_config_selects_tick_strategy():
+    assert isinstance(build_from_config(config.QUARRY), ContinuousBuilding)
+    assert isinstance(build_from_config(config.SAWMILL), CycleBuilding)
+
+
+def test_config_tables_are_read_only():
+    with pytest.raises(TypeError):
+        config.BUILDING_RECIPES[config.QUARRY] = config.BUILDING_RECIPES[config.SAWMILL]
+    with pytest.raises(TypeError):
+        config.CAPACIDADES[Resource.WOOD] = 1.0
+    with pytest.raises(TypeError):
+        config.BUILDING_RECIPES[config.SAWMILL].inputs[Resource.WOOD] = 0.0
+
+
+def test_recipe_normalises_equal_tables():
+    sawmill = config.BUILDING_RECIPES[config.SAWMILL]
+    recipe = config.make_recipe(
+        inputs=dict(sawmill.inputs),
+        outputs={"plank": 2},
+        cycle_time=sawmill.cycle_time,
+        max_workers=sawmill.max_workers,
+    )
+    twin = config.make_recipe(
+        inputs=dict(sawmill.inputs),
+        outputs={Resource.PLANK: 2.0},
+        cycle_time=sawmill.cycle_time,
+        max_workers=sawmill.max_workers,
+    )
+
+    assert recipe == twin
+    assert recipe.inputs == sawmill.inputs
+    assert recipe.outputs == {Resource.PLANK: 2.0}
+    assert recipe.maintenance == {}
+    with pytest.raises(TypeError):
+        recipe.outputs[Resource.PLANK] = 3.0
+    with pytest.raises(TypeError):
+        recipe.maintenance[Resource.GOLD] = 1.0
+
+
+def test_season_multiplier_matches_modifier_product():
+    clock = SeasonClock(season_modifiers=config.SEASON_MODIFIERS)
+    for _ in clock.seasons:
+        for tag in (config.FARMER, config.SAWMILL, config.QUARRY, None):
+            expected = 1.0
+            for value in clock.get_modifiers(tag).values():
+                expected *= value
+            assert clock.get_multiplier(tag) == pytest.approx(expected)
+        clock.update(clock.ticks_per_season)
+
+
+def test_recipe_exposes_per_second_rates():
+    recipe = config.BUILDING_RECIPES[config.SAWMILL]
+
+    for resource, amount in recipe.outputs.items():
+        assert recipe.outputs_per_second[resource] == pytest.approx(amount / recipe.cycle_time)
+    for resource, amount in recipe.inputs.items():
+        assert recipe.inputs_per_second[resource] == pytest.approx(amount / recipe.cycle_time)
+
+
+def test_building_tables_are_read_only():
+    with pytest.raises(TypeError):
+        config.BUILD_COSTS[config.QUARRY] = {}
+    with pytest.raises(TypeError):
+        config.BUILDING_NAMES[config.QUARRY] = "Quarry"
+    with pytest.raises(TypeError):
+        config.BUILDING_METADATA[config.QUARRY] = config.get_building_metadata(config.QUARRY)
+
+
+def test_legacy_cost_alias_warns_once():
+    # Run in a fresh interpreter so the one-time warning does not depend on
+    # whether another test already touched the alias.
+    code = (
+        "import warnings\n"
+        "from core import config\n"
+        "with warnings.catch_warnings(record=True) as caught:\n"
+        "    warnings.simplefilter('always')\n"
+        "    assert config.COSTOS_CONSTRUCCION is config.BUILD_COSTS\n"
+        "    assert config.COSTOS_CONSTRUCCION is config.BUILD_COSTS\n"
+        "print(sum(issubclass(w.category, DeprecationWarning) for w in caught))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "1"
+
+
+def test_resource_flow_index_matches_recipes():
+    for type_key, recipe in config.BUILDING_RECIPES.items():
+        for resource, amount in recipe.outputs.items():
+            if amount > 0:
+                assert type_key in config.producers_of(resource)
+        for resource, amount in recipe.inputs.items():
+            if amount > 0:
+                assert type_key in config.consumers_of(resource)
+    assert config.SAWMILL in config.consumers_of(Resource.WOOD)
+    assert config.SAWMILL not in config.producers_of(Resource.WOOD)
+
+
+def test_snapshot_static_fields_follow_capacity():
+    building = build_from_config(config.SAWMILL)
+    building.built = 1
+    first = building.to_snapshot()
+    first["inputs"].clear()
+
+    building.built = 2
+    second = building.to_snapshot()
+
+    assert second["inputs"]
+    assert second["max_workers"] == building.max_workers
+    for resource, rate in second["per_worker_output_rate"].items():
+        expected = building.recipe.outputs_per_second[Resource(resource)] / building.max_workers
+        assert rate == pytest.approx(expected)
+
+
+def test_build_refund_scales_cost():
+    refund = config.build_refund(config.SAWMILL, 0.3)
+    for resource, amount in config.build_cost(config.SAWMILL).items():
+        assert refund[resource] == pytest.approx(amount * 0.3)
+    assert config.build_refund(config.SAWMILL, 0.3) is refund
+    assert not config.build_refund(config.SAWMILL, 0.0)
+
+
+def test_max_workers_follows_recipe_changes():
+    building = build_from_config(config.SAWMILL)
+    building.built = 1
+    assert building.max_workers == config.BUILDING_RECIPES[config.SAWMILL].max_workers
+
+    building.recipe = config.BUILDING_RECIPES[config.QUARRY]
+
+    expected = config.BUILDING_RECIPES[config.QUARRY].max_workers
+    assert building.max_workers == expected
+    assert building.to_snapshot()["max_workers"] == expected
+
+
+def test_building_accepts_production_report_keyword():
+    recipe = config.BUILDING_RECIPES[config.SAWMILL]
+    report = {"status": "inactive", "reason": "inactive", "detail": None, "consumed": {}, "produced": {}}
+
+    building = CycleBuilding(
+        type_key=config.SAWMILL, recipe=recipe, name="Sawmill", production_report=report
+    )
+    default = CycleBuilding(type_key=config.SAWMILL, recipe=recipe, name="Sawmill")
+
+    assert building.production_report is report
+    assert default.production_report["status"] == "inactive"
+
+
+def test_building_metadata_is_built_on_first_use():
+    code = (
+        "from core import buildings, config\n"
+        "assert 'BUILDING_METADATA' not in vars(config)\n"
+        "meta = config.get_building_metadata('basic_grain_extractor')\n"
+        "assert meta.category == 'resource', meta\n"
+        "assert config.BUILDING_METADATA['basic_grain_extractor'] is meta\n"
+        "assert config.get_building_metadata(config.WOODCUTTER_CAMP).job == 'forester'\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        check=True,
+    )